@@ -6,63 +6,178 @@ This module implements the pytest_exception_interact hook to ensure all unhandle
 exceptions are displayed with detailed location information during test runs.
 """
 
-import sys
-import traceback
+import os
 import re
-import pytest
-from _pytest.config import hookimpl
-import builtins
+import sys
+import site
+import sysconfig
+import linecache
+from pytest import hookimpl
 original_excepthook = sys.excepthook
 
+# Standard library and installed package locations (including `pip install --user` ones),
+# frames from these are not user code. Each ends with a separator, so .../python3.11
+# does not also match .../python3.11-foo
+_STDLIB_PREFIXES = tuple({
+    os.path.join(path, '')
+    for path in (
+        sysconfig.get_paths()['stdlib'],
+        sysconfig.get_paths()['platstdlib'],
+        sysconfig.get_paths()['purelib'],
+        sysconfig.get_paths()['platlib'],
+        *getattr(site, 'getsitepackages', lambda: [])(),
+        *([site.getusersitepackages()] if site.ENABLE_USER_SITE else []),
+    )
+})
 
-# Common function to format and display exception details
-def format_exception_details(exc_type, exc_value, exc_traceback):
+# Fixed text of the exception details blocks
+_BANNER_START = "\n==== EXCEPTION DETAILS ====\n"
+_BANNER_END = "==== END EXCEPTION DETAILS ====\n\n"
+_INTERNAL_BANNER_START = "\n==== INTERNAL ERROR DETAILS ====\n"
+_INTERNAL_BANNER_END = "==== END INTERNAL ERROR DETAILS ====\n\n"
+_TYPE_LABEL = "Exception Type: "
+_MESSAGE_LABEL = "Exception Message: "
+_LOCATION_LABEL = "Location: "
+
+# Exceptions the custom excepthook passes to the original hook without formatting
+_PASSTHROUGH_EXCEPTIONS = (AssertionError, KeyboardInterrupt, SystemExit)
+
+# Bracket pairs for the data dumps shortened in AssertionError reports
+_DUMP_BRACKETS = {'{': '}', '[': ']'}
+# Reports shorter than this are left as is
+_MIN_STRIP_LENGTH = 2048
+_IDENTIFIER_CHARS = frozenset('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_')
+# What matters when matching dump brackets: quoted strings (skipped whole, escapes included) and brackets
+# Start of a possible dump, reports without one are not scanned
+_DUMP_START_RE = re.compile(r'=\s*[\[{]')
+_DUMP_TOKEN_RE = re.compile(r"""'(?:[^'\\\n]|\\.)*'|"(?:[^"\\\n]|\\.)*"|[\[\]{}]""")
+
+
+def _strip_data_dumps(text):
     """
-    Format exception details in a consistent way.
-    
-    Returns True if the exception was handled, False otherwise.
+    Shorten variable dumps like `name = {...}` and `name = [...]` in one pass.
+
+    The `test_cases = [...]` dump also drops the whitespace that follows it.
+    Brackets are matched by depth, so nested data is collapsed as a whole;
+    brackets inside quoted strings don't count.
     """
-    # Skip AssertionErrors
-    if exc_type == AssertionError:
-        return False
-        
-    # Get the most recent frame from the traceback for location information
-    tb_frames = traceback.extract_tb(exc_traceback)
-    
-    # Find the frame from the user's code (not from pytest or library code)
-    user_frame = None
-    for frame in reversed(tb_frames):
-        if '/site-packages/' not in frame.filename and '/usr/lib/' not in frame.filename:
-            user_frame = frame
-            break
-    
-    if not user_frame and tb_frames:
-        user_frame = tb_frames[-1]  # Use the most recent frame if no user frame found
-    
+    out = []
+    copied_to = 0  # End of the text already copied to out
+    eq = text.find('=')
+    while eq != -1:
+        # Identifier before the '=' (skipping whitespace)
+        name_end = eq
+        while name_end > copied_to and text[name_end - 1].isspace():
+            name_end -= 1
+        name_start = name_end
+        while name_start > copied_to and text[name_start - 1] in _IDENTIFIER_CHARS:
+            name_start -= 1
+        while name_start < name_end and text[name_start].isdigit():
+            name_start += 1
+
+        # Opening bracket after the '=' (skipping whitespace)
+        open_pos = eq + 1
+        while open_pos < len(text) and text[open_pos].isspace():
+            open_pos += 1
+        open_char = text[open_pos] if open_pos < len(text) else ''
+
+        if name_start == name_end or open_char not in _DUMP_BRACKETS:
+            eq = text.find('=', eq + 1)
+            continue
+
+        # Find the matching closing bracket, skipping brackets inside quoted strings
+        close_char = _DUMP_BRACKETS[open_char]
+        depth = 1
+        for token in _DUMP_TOKEN_RE.finditer(text, open_pos + 1):
+            char = token.group()
+            if char == open_char:
+                depth += 1
+            elif char == close_char:
+                depth -= 1
+                if not depth:
+                    pos = token.end()
+                    break
+        if depth:
+            # Unbalanced brackets, leave this dump as is
+            eq = text.find('=', eq + 1)
+            continue
+
+        name = text[name_start:name_end]
+        out.append(text[copied_to:name_start])
+        out.append(f"{name} = {open_char}...{close_char}")
+        if name == 'test_cases':
+            while pos < len(text) and text[pos].isspace():
+                pos += 1
+            out.append(' ')
+        copied_to = pos
+        eq = text.find('=', pos)
+
+    out.append(text[copied_to:])
+    return ''.join(out)
+
+
+def _extract_user_frame(exc_traceback):
+    """
+    Find the most relevant frame in a traceback and its source line.
+
+    Returns a (location, code_line) tuple.
+    """
+    # Follow the traceback links directly, keeping only the most recent user frame
+    last_user = None
+    last_any = None
+    tb = exc_traceback
+    while tb is not None:
+        code = tb.tb_frame.f_code
+        last_any = (code.co_filename, tb.tb_lineno, code.co_name)
+        # Skip frames from pytest or library code
+        if not code.co_filename.startswith(_STDLIB_PREFIXES):
+            last_user = last_any
+        tb = tb.tb_next
+
+    # Use the most recent frame if no user frame found
+    user_frame = last_user or last_any
+
     # Format location information if available
-    location = f"{user_frame.filename}:{user_frame.lineno} (in {user_frame.name})" if user_frame else "unknown location"
-    
-    # Get the actual code line from the file
+    location = "unknown location"
     code_line = ""
     if user_frame:
+        filename, lineno, name = user_frame
+        location = f"{filename}:{lineno} (in {name})"
+
+        # Get the actual code line from the file (linecache keeps file contents between calls)
         try:
-            with open(user_frame.filename, 'r') as f:
-                lines = f.readlines()
-                if 0 <= user_frame.lineno - 1 < len(lines):
-                    code_line = lines[user_frame.lineno - 1].strip()
+            code_line = linecache.getline(filename, lineno).strip()
         except Exception:
             pass
+
+    return location, code_line
+
+
+def _write_details(banner_start, banner_end, type_name, message, location, code_line):
+    """Write one exception details block to the real stderr in a single write."""
+    code = f"\n    {code_line}\n" if code_line else ""
+    sys.__stderr__.write(
+        f"{banner_start}{_TYPE_LABEL}{type_name}\n{_MESSAGE_LABEL}{message}\n{_LOCATION_LABEL}{location}\n"
+        f"{code}{banner_end}"
+    )
+    sys.__stderr__.flush()
+
+
+# Common function to format and display exception details
+def format_exception_details(exc_type, exc_value, exc_traceback):
+    """
+    Format exception details in a consistent way.
+
+    AssertionErrors are skipped, the test output already explains them.
+    """
+    # Skip AssertionErrors
+    if exc_type is AssertionError:
+        return
+
+    location, code_line = _extract_user_frame(exc_traceback)
     
-    # Print directly to stderr to bypass pytest's output capture
-    print(f"\n==== EXCEPTION DETAILS ====", file=sys.__stderr__)
-    print(f"Exception Type: {exc_type.__name__}", file=sys.__stderr__)
-    print(f"Exception Message: {exc_value}", file=sys.__stderr__)
-    print(f"Location: {location}", file=sys.__stderr__)
-    if code_line:
-        print(f"\n    {code_line}", file=sys.__stderr__)
-    print("==== END EXCEPTION DETAILS ====\n", file=sys.__stderr__)
-    
-    return True
+    # Write directly to stderr to bypass pytest's output capture
+    _write_details(_BANNER_START, _BANNER_END, exc_type.__name__, exc_value, location, code_line)
 
 
 def pytest_exception_interact(report, call):
@@ -87,97 +202,72 @@ def pytest_internalerror(excrepr, excinfo):
     It prints concise information about internal pytest errors directly to stderr.
     """
     try:
-        tb_frames = traceback.extract_tb(excinfo.tb)
-
-        # Find the frame from the user's code (not from pytest or library code)
-        user_frame = None
-        for frame in reversed(tb_frames):
-            if '/site-packages/' not in frame.filename and '/usr/lib/' not in frame.filename:
-                user_frame = frame
-                break
-
-        if not user_frame and tb_frames:
-            user_frame = tb_frames[-1]  # Use the most recent frame if no user frame found
-
-        location = f"{user_frame.filename}:{user_frame.lineno} (in {user_frame.name})" if user_frame else "unknown location"
-
-        # Get the actual code line from the file
-        code_line = ""
-        if user_frame:
-            try:
-                with open(user_frame.filename, 'r') as f:
-                    lines = f.readlines()
-                    if 0 <= user_frame.lineno - 1 < len(lines):
-                        code_line = lines[user_frame.lineno - 1].strip()
-            except Exception:
-                pass
+        location, code_line = _extract_user_frame(excinfo.tb)
     except Exception:
         location = "unknown location"
         code_line = ""
 
-    # Print directly to stderr to bypass pytest's output capture
-    print(f"\n==== INTERNAL ERROR DETAILS ====", file=sys.__stderr__)
-    print(f"Exception Type: {excinfo.type.__name__}", file=sys.__stderr__)
-    print(f"Exception Message: {excinfo.value}", file=sys.__stderr__)
-    print(f"Location: {location}", file=sys.__stderr__)
-    if code_line:
-        print(f"\n    {code_line}", file=sys.__stderr__)
-    print("==== END INTERNAL ERROR DETAILS ====\n", file=sys.__stderr__)
+    # Write directly to stderr to bypass pytest's output capture
+    _write_details(_INTERNAL_BANNER_START, _INTERNAL_BANNER_END, excinfo.type.__name__, excinfo.value, location, code_line)
 
 
 # Create a custom exception hook to catch all exceptions
 def custom_excepthook(exc_type, exc_value, exc_traceback):
     """Custom exception hook to display all exceptions in our format."""
-    # Use the common formatting function
-    if format_exception_details(exc_type, exc_value, exc_traceback):
-        # If the exception was handled by our formatter, still call the original
-        # excepthook to maintain normal behavior
-        return original_excepthook(exc_type, exc_value, exc_traceback)
-    else:
-        # If our formatter didn't handle it (e.g., for AssertionErrors),
-        # just use the original excepthook
-        return original_excepthook(exc_type, exc_value, exc_traceback)
+    # Assertions and interpreter exits are left to the original excepthook alone
+    if exc_type not in _PASSTHROUGH_EXCEPTIONS:
+        format_exception_details(exc_type, exc_value, exc_traceback)
 
+    # Always call the original excepthook to maintain normal behavior
+    return original_excepthook(exc_type, exc_value, exc_traceback)
 
-# Install our custom exception hook
-sys.excepthook = custom_excepthook
 
+def pytest_configure(config):
+    """Install our custom exception hook for the duration of the test run."""
+    global original_excepthook
+    original_excepthook = sys.excepthook
+    sys.excepthook = custom_excepthook
 
-@hookimpl(trylast=True)
+
+def pytest_unconfigure(config):
+    """Restore the exception hook that was active before the test run."""
+    sys.excepthook = original_excepthook
+
+
+@hookimpl(trylast=True, optionalhook=True)
 def pytest_runtest_logreport(report):
     """
     Modify the test report to hide test case details in the output.
     
     This hook intercepts the test report before it's displayed and removes
-    detailed test case data that can clutter the output.
+    detailed test case data that can clutter the output. Only the lines of the
+    traceback entries are rewritten, the report keeps its crash summary for
+    `-r` summaries, junitxml and other plugins.
     """
-    # Only modify AssertionError reports, not other exceptions
-    if (report.when == "call" and 
-        hasattr(report, "longrepr") and 
-        report.longrepr and 
-        hasattr(report, "excinfo") and 
-        report.excinfo and 
-        report.excinfo.type == AssertionError):
-        
-        # Convert longrepr to string if it's not already
-        if not isinstance(report.longrepr, str):
-            longrepr_str = str(report.longrepr)
-        else:
-            longrepr_str = report.longrepr
-            
-        # Remove test case data from the output
-        # This pattern matches Python data structures that are typically test cases
-        simplified = re.sub(r'test_cases\s*=\s*\[.*?\]\s*', 'test_cases = [...] ', longrepr_str, flags=re.DOTALL)
-        
-        # Also remove other variable dumps that contain large data structures
-        simplified = re.sub(r'([a-zA-Z_][a-zA-Z0-9_]*)\s*=\s*\{[^{}]*(\'[^\']*\'[^{}]*)*\}', r'\1 = {...}', simplified)
-        simplified = re.sub(r'([a-zA-Z_][a-zA-Z0-9_]*)\s*=\s*\[[^\[\]]*(\'[^\']*\'[^\[\]]*)*\]', r'\1 = [...]', simplified)
-        
-        # If longrepr is an object with a string representation, we need to modify it differently
-        if not isinstance(report.longrepr, str):
-            try:
-                report.longrepr.reprtraceback.reprentries[-1].reprfileloc.message = simplified
-            except (AttributeError, IndexError):
-                pass  # If we can't modify it this way, leave it as is
-        else:
-            report.longrepr = simplified
+    # Only modify failed AssertionError reports from the test call, return early for everything else
+    if report.when != "call" or not report.failed or not report.longrepr:
+        return
+    # TestReport keeps no excinfo; the crash summary starts with the exception type instead
+    reprcrash = getattr(report.longrepr, "reprcrash", None)
+    if reprcrash is None or not reprcrash.message.startswith("AssertionError"):
+        return
+
+    longrepr_str = str(report.longrepr)
+
+    # Short reports are already concise, nothing worth stripping
+    if len(longrepr_str) < _MIN_STRIP_LENGTH:
+        return
+
+    # Nothing to strip without an `= [` or `= {` (with or without whitespace, as the scanner accepts)
+    if not _DUMP_START_RE.search(longrepr_str):
+        return
+
+    # Remove test case data and other large data structures from each entry of each
+    # chained traceback; a dump can span several lines, so an entry is stripped as a whole
+    chain = getattr(report.longrepr, "chain", None) or [(report.longrepr.reprtraceback, reprcrash, None)]
+    for reprtraceback, _, _ in chain:
+        for entry in reprtraceback.reprentries:
+            entry_text = "\n".join(entry.lines)
+            stripped = _strip_data_dumps(entry_text)
+            if stripped != entry_text:
+                entry.lines = stripped.split("\n")
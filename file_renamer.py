@@ -32,9 +32,12 @@ import os
 import re
 import sys
 import errno
+import functools
+import shutil
 import traceback
 from typing import Dict, List, Tuple, Set, Optional
 from pathlib import Path
+from types import MappingProxyType
 import unicodedata
 import logging
 import argparse
@@ -43,9 +46,10 @@ from colorama import init, Fore, Style
 # Initialize colorama for cross-platform color support
 init()
 
+@functools.cache
 def get_debug_level() -> str:
     """
-    Get the debug level from environment. Returns one of:
+    Get the debug level from environment, read once per process. Returns one of:
     - 'detail': Show all processing steps (RENAMER_DEBUG=detail)
     - 'normal': Show key transformations only (RENAMER_DEBUG=1 or running tests)
     - 'off': No debug output (default)
@@ -57,6 +61,19 @@ def get_debug_level() -> str:
         return 'normal'
     return 'off'
 
+# This logger only holds the debug level ('normal' is DEBUG, 'detail' is DETAIL), nothing is logged
+# through it. debug_print checks the level and prints to stdout; call sites with costly messages check
+# logger.isEnabledFor first, so their f-strings are only built when the message is shown.
+DETAIL = 5
+logging.addLevelName(DETAIL, 'DETAIL')
+logger = logging.getLogger(__name__)
+logger.setLevel({'detail': DETAIL, 'normal': logging.DEBUG}.get(get_debug_level(), logging.WARNING))
+
+
+def _compact_per_unit(s: str) -> str:
+    """UNIT_PATTERNS formatter for rates: '30 / hr' -> '30⧸hr' (no spaces, slash replaced)"""
+    return ''.join(s.split()).translate(FileRenamer._PER_UNIT_TABLE)
+
 class FileRenamer:
     """Handles the conversion of filenames from Ext4 to NTFS format.
 
@@ -70,14 +87,14 @@ class FileRenamer:
     """
 
     # Multi-character replacements that are valid
-    MULTI_CHAR_REPLACEMENTS = {
+    MULTI_CHAR_REPLACEMENTS = frozenset({
         '...', '<<', '>>', '[[', ']]', '{{', '}}',  # Special sequences
         # Commented out fraction patterns - keeping for reference
         # '1/2', '1/3', '2/3', '1/4', '3/4',          # Common fractions
         # '1/5', '2/5', '3/5', '4/5',
         # '1/6', '5/6',
         # '1/8', '3/8', '5/8', '7/8'
-    }
+    })
 
     # Can't put apostrophe in CHAR_REPLACEMENTS, since might replace with Single Right Quote or with Full Width Quotation Mark or Modifier Letter Apostrophe
     # Unicode characters for quote handling
@@ -87,35 +104,41 @@ class FileRenamer:
     ASCII_APOSTROPHE = "'"             # ASCII apostrophe (will be converted)
     APOSTROPHE_REPLACEMENT = MODIFIER_LETTER_APOSTROPHE  # Or ASCII_APOSTROPHE if no replacement desired
 
-    QUOTE_LIKE_CHARS = {
+    QUOTE_LIKE_CHARS = frozenset({
         ASCII_APOSTROPHE,              # Will be converted based on context
         LEFT_SINGLE_QUOTE,             # Will be preserved
         RIGHT_SINGLE_QUOTE,            # Will be preserved if from original text
         APOSTROPHE_REPLACEMENT,        # Used for contractions/possessives
-    }
+    })
+
+    # Quote-like chars that final_quote_processing converts to APOSTROPHE_REPLACEMENT,
+    # everything except original left quotes and existing modifier letter apostrophes
+    _QUOTES_TO_APOSTROPHE_TABLE = str.maketrans(dict.fromkeys(
+        ({ASCII_APOSTROPHE} | QUOTE_LIKE_CHARS) - {LEFT_SINGLE_QUOTE, MODIFIER_LETTER_APOSTROPHE},
+        APOSTROPHE_REPLACEMENT))
 
     # All forms of slashes to be replaced with full width solidus
     FULLWIDTH_SOLIDUS_OPERATOR = '\uFF0F'
-    SLASHES = {
+    SLASHES = frozenset({
         '\\',           # ASCII backslash
         '/',           # ASCII forward slash
         '\u2044',      # FRACTION SLASH
         '\u2215',      # DIVISION SLASH
         '\u29F5',  # Better spacing than DIVISION_SLASH
-    }
+    })
     SLASH_REPLACEMENT = FULLWIDTH_SOLIDUS_OPERATOR  # will replace all forward slashes, and ASCII backslash, with Full Width Solidus Operator
 
     # Date format separators to preserve in date patterns
-    DATE_SEPARATORS = {
+    DATE_SEPARATORS = frozenset({
         '.',           # period
         '-',           # hyphen
         SLASH_REPLACEMENT,  # for any slash in original
-    }
+    })
 
     # Characters to collapse when repeated (not illegal, but often repeated for emphasis)
     # Format: 'character': (min_repeats, replacement)
     # If replacement is None, collapse to a single instance of the original character
-    CHARS_TO_COLLAPSE = {
+    CHARS_TO_COLLAPSE = MappingProxyType({
         '-': (2, '—'),           # 2+ dashes become em dash (common typographic convention)
         '_': (2, None),          # 2+ underscores collapse to single underscore
         '=': (2, None),          # 2+ equals signs collapse to single equals
@@ -124,7 +147,71 @@ class FileRenamer:
         '*': (2, None),          # 2+ asterisks collapse to single asterisk
         '~': (2, None),          # 2+ tildes collapse to single tilde
         '!': (2, None),          # 2+ exclamation marks collapse to single exclamation
-    }
+    })
+
+    # Single regex matching a run of any CHARS_TO_COLLAPSE character, so all are collapsed in one pass
+    _COLLAPSE_RE = re.compile('|'.join(
+        f'{re.escape(char)}{{{min_repeats},}}' for char, (min_repeats, _) in CHARS_TO_COLLAPSE.items()
+    ))
+
+    # Run of a repeated emoji; group 2 is the single emoji
+    _EMOJI_RUN_RE = re.compile(
+        "(("
+        "["
+        "\U0001F600-\U0001F64F"  # emoticons
+        "\U0001F300-\U0001F5FF"  # symbols & pictographs
+        "\U0001F680-\U0001F6FF"  # transport & map symbols
+        "\U0001F700-\U0001F77F"  # alchemical symbols
+        "\U0001F780-\U0001F7FF"  # Geometric Shapes
+        "\U0001F800-\U0001F8FF"  # Supplemental Arrows-C
+        "\U0001F900-\U0001F9FF"  # Supplemental Symbols and Pictographs
+        "\U0001FA00-\U0001FA6F"  # Chess Symbols
+        "\U0001FA70-\U0001FAFF"  # Symbols and Pictographs Extended-A
+        "\U00002702-\U000027B0"  # Dingbats
+        "\U000024C2-\U0001F251"
+        "]"
+        ")\\2+)"
+    )
+
+    # Run of whitespace, including newlines and tabs, to normalize to a single space
+    _WHITESPACE_RUN_RE = re.compile(r'[ \n\r\t\f\v]+')
+
+    # Patterns used while cleaning each filename, compiled once
+    _FRACTION_RE = re.compile(r'(\d)\s*/\s*(\d)')  # 1/2, 3 / 4
+    _TERM_PUNCTUATION_RE = re.compile(r'[\s\-.,;:"&!?()]')  # Removed to normalize preserved terms
+    _MULTIPLE_SPACES_RE = re.compile(r' {2,}')
+    _ANY_WHITESPACE_RE = re.compile(r'\s+')
+    _ADJACENT_MARKERS_RE = re.compile(r'(__PRESERVED_TERM_\d+__)(__PRESERVED_TERM_\d+__)')
+    _DATE_PATTERNS = (
+        re.compile(r'\b(\d{1,4})\.([A-Za-z]{3,})\.?(\d{1,4})?\b'),      # number.month.number (12.Jan.2025)
+        re.compile(r'\b([A-Za-z]{3,})\.?(\d{1,4})(\.\d{1,4})?\b'),       # month.number (Jan.2025), month.number.number (Jan.12.2025)
+        re.compile(r'\b(\d{1,4})\.(\d{1,4})\.([A-Za-z]{3,})\b'),         # number.number.month (2025.12.Jan)
+        re.compile(r'\b([A-Za-z]{3,})\.([A-Za-z]{3,})\.?(\d{1,4})?\b'),  # month.month.year (Jan.Feb.2025)
+    )
+    _TIME_RE = re.compile(r'\d+[ap]m\b', re.IGNORECASE)  # 9am, 10PM
+    _DIGITS_RE = re.compile(r'\d+')
+    _NUMBER_UNIT_START_RE = re.compile(r'^\d+[kmgtw]?[wvajnlhzbfω][h]?')  # 5kw, 10wh
+    _NUMBER_LETTER_START_RE = re.compile(r'^\d+[a-z]|^[a-z]+\d')  # 2025jan, jan2025
+    _UNIT_START_RE = re.compile(r'^[kmgtw]?[wvajnlhzbfg]')
+    _NUMBER_BYTES_RE = re.compile(r'\d+[kmgt]?b(?:ps)?\b', re.IGNORECASE)  # 5kb, 10Mbps
+    _BYTES_UNIT_RE = re.compile(r'[kmgt]?b(?:ps)?\b', re.IGNORECASE)
+    _B_CASE_RE = re.compile(r'[bB](?:[pP][sS])?\b')
+    _NUMBER_PREFIX_RE = re.compile(r'(\d+)([kmgt])?', re.IGNORECASE)
+    _NUMBER_WORD_RE = re.compile(r'^(\d+)([a-z]+)$')  # 3rd, 10x
+    _PERIOD_SPLIT_RE = re.compile(r'([.])')
+    _PERIOD_LETTER_RE = re.compile(r'\.([a-zA-Z])')
+
+    # Letter-based abbreviations with periods, cleaned in this order by _clean_common_abbreviation_patterns
+    _ABBREVIATION_PATTERNS = (
+        # Pattern 1: Multi-letter abbreviations with periods (M.D., Ph.D., B.Sc., M.Phil.)
+        re.compile(r'(?:^|(?<=\W))([A-Za-z]+(?:\.[A-Za-z]+)+\.?)(?=\W|$)', re.IGNORECASE),
+        # Pattern 2: Abbreviations with periods and internal spaces (e.g. 'Lt. Col.', 'Prof. Dr.')
+        # Process this BEFORE pattern 3 to catch multi-part abbreviations
+        re.compile(r'(?:^|(?<=\W))([A-Za-z][A-Za-z]*\. [A-Za-z][A-Za-z0-9]*\.)(?=\W|$)', re.IGNORECASE),
+        # Pattern 3: Common abbreviations with trailing period (Dr., Mr., Ms., etc.)
+        # Only match short words (1-3 letters) to avoid matching regular words with periods
+        re.compile(r'(?:^|(?<=\W))([A-Za-z]{1,3}\.)(?=\s|$)', re.IGNORECASE),
+    )
 
     # Character substitution mappings
     CHAR_REPLACEMENTS = {
@@ -176,15 +263,27 @@ class FileRenamer:
         '﹢': '＆',  # Small And replaced with Full-Width Ampersand
         '$': '＄',  # Full Width Dollar Sign
         '...': '…',  # Replace three or more periods with ellipsis character
+        # Slash replacements after main mappings
+        **dict.fromkeys(SLASHES, SLASH_REPLACEMENT),
     }
 
-    # Add slash replacements after main mappings
-    for slash in SLASHES:
-        CHAR_REPLACEMENTS[slash] = SLASH_REPLACEMENT
+    # No changes to this mapping in place; the lookup tables derived from it are built by
+    # _build_replacement_tables, and rebuilt if CHAR_REPLACEMENTS is replaced (e.g. by tests)
+    CHAR_REPLACEMENTS = MappingProxyType(CHAR_REPLACEMENTS)
+    _replacement_tables_source = None  # The CHAR_REPLACEMENTS the tables were built from
+
+    # Template that colors a replacement char cyan like colorize() does
+    _CYAN_MATCH = f'{Fore.CYAN}\\g<0>{Style.RESET_ALL}'
 
     # Shorthand for readability
     R = CHAR_REPLACEMENTS
 
+    # Stands in for periods inside preserved terms while periods are processed
+    _PRESERVED_PERIOD_PLACEHOLDER = '__PRESERVED_TERM_PERIOD__'
+
+    # Replacement template for _FRACTION_RE: 1/2 -> 1／2
+    _FRACTION_REPL = fr'\1{R["/"]}\2'
+
     # List of terms with specific capitalization and punctuation to preserve exactly
     # These built-in terms can be supplemented with user-defined terms from settings.ini
     PRESERVED_TERMS = [
@@ -198,8 +297,13 @@ class FileRenamer:
     USER_ABBREVIATIONS = set()
     USER_PRESERVED_TERMS = set()
 
+    # Set by _class_init once the derived class-level data has been built
+    _initialized = False
+    _abbreviation_index_source = None  # The ABBREVIATIONS _ABBREVIATIONS_BY_UPPER was built from
+    _MEMO_SIZE = 4096  # Most names kept in an instance's memo of cleaned names
+
     # Common abbreviations to preserve case
-    ABBREVIATIONS = {
+    ABBREVIATIONS = frozenset({
         # Academic Degrees (use periods just for testing the clean_abbreviation function)
         'B.A', 'B.S', 'M.A', 'M.B.A', 'M.D', 'M.S', 'Ph.D', 'J.D', 'BSc', 'MSc', 'MPhil',
 
@@ -331,10 +435,10 @@ class FileRenamer:
         # Apple products and special case words (merged from SPECIAL_CASE_WORDS)
         'iPad', 'iPhone', 'iPod', 'iTunes', 'iMac',
         'macOS', 'iOS',  # Operating systems
-    }
+    })
 
     # Units that can appear standalone without numbers
-    STANDALONE_UNITS = {
+    STANDALONE_UNITS = frozenset({
         'hr', 'h',    # hour
         'min',       # minute (but not 'm' which is meters)
         's', 'sec',  # second
@@ -344,7 +448,7 @@ class FileRenamer:
         'yr',        # year
         'sq',        # square
         'sqm'        # square meters
-    }
+    })
 
     # Common units in filenames that need specific capitalization
     R = CHAR_REPLACEMENTS  # Shorthand for readability
@@ -486,7 +590,7 @@ class FileRenamer:
     # In __init__, MONTH_FORMATS values get added to:
     # 1. ABBREVIATIONS - to handle dates with separators like 25-Jan-12
     # 2. UNIT_PATTERNS - to handle dates without separators like 2025jan12
-    MONTH_FORMATS = {
+    MONTH_FORMATS = MappingProxyType({
         # English full names
         'january': 'January', 'february': 'February', 'march': 'March',
         'april': 'April', 'may': 'May', 'june': 'June', 'july': 'July',
@@ -503,10 +607,10 @@ class FileRenamer:
         'noviembre': 'Noviembre', 'diciembre': 'Diciembre',
         # Spanish abbreviations
         'ene': 'Ene', 'abr': 'Abr', 'ago': 'Ago', 'dic': 'Dic'
-    }
+    })
 
     # Common words that should not be capitalized in titles
-    LOWERCASE_WORDS = {
+    LOWERCASE_WORDS = frozenset({
         # Articles
         'a', 'an', 'the',
 
@@ -530,11 +634,11 @@ class FileRenamer:
         # Spanish
         'a', 'con', 'de', 'del', 'el', 'la', 'las', 'lo', 'los',
         'para', 'por', 'que', 'su', 'una', 'unas', 'unos', 'y'
-    }
+    })
 
     # Dictionary for words that should only be kept capitalized if they appear in all caps
     # Otherwise they should be converted to lowercase
-    KEEP_CAPITALIZED_IF_ALLCAPS = {
+    KEEP_CAPITALIZED_IF_ALLCAPS = MappingProxyType({
         # Alphabetically sorted by key
         'AS': 'as',   # American Samoa - 'as' conjunction/adverb
         'BY': 'by',   # Belarus - 'by' preposition
@@ -578,10 +682,10 @@ class FileRenamer:
         'US': 'us',  # United States - 'us' English word
         'VER': 'ver', # Veracruz (Mexican state) - 'ver' version abbreviation
         'WA': 'wa',  # Washington - 'wa' Spanish dialect word
-    }
+    })
 
     # All opening bracket characters (ASCII and replacements)
-    OPENING_BRACKETS = {
+    OPENING_BRACKETS = frozenset({
         # ASCII opening brackets
         '(', '[', '{', '<',
         # Replacement opening brackets
@@ -597,10 +701,10 @@ class FileRenamer:
         '〔',     # Left Tortoise Shell Bracket
         '〈',     # Left Angle Bracket
         '「',     # Left Corner Bracket
-    }
+    })
 
     # All closing bracket characters (ASCII and replacements)
-    CLOSING_BRACKETS = {
+    CLOSING_BRACKETS = frozenset({
         # ASCII closing brackets
         ')', ']', '}', '>',
         # Replacement closing brackets
@@ -616,10 +720,10 @@ class FileRenamer:
         '〕',     # Right Tortoise Shell Bracket
         '〉',     # Right Angle Bracket
         '」',     # Right Corner Bracket
-    }
+    })
 
     # Characters that trigger capitalization of the next word
-    CAPITALIZATION_TRIGGERS = {
+    CAPITALIZATION_TRIGGERS = frozenset({
         '.',  # Period
         '-',  # Dash/Hyphen
         R['...'],  # Ellipsis
@@ -628,18 +732,18 @@ class FileRenamer:
         '¿',   # Spanish inverted question mark
         '¡',   # Spanish inverted exclamation mark
         *OPENING_BRACKETS  # All opening brackets
-    }
+    })
 
     # Characters that are allowed at the end of a filename
-    ALLOWED_TRAILING_CHARS = CLOSING_BRACKETS | {
+    ALLOWED_TRAILING_CHARS = frozenset(CLOSING_BRACKETS | {
         '!',            # Exclamation mark
         R['$'],         # Full Width Dollar Sign
         R['"'],        # Full Width Quotation Mark
         R['?'],         # Double Question Mark
-    }
+    })
 
     # Only include special characters that should act as word boundaries
-    WORD_BOUNDARY_CHARS = {
+    WORD_BOUNDARY_CHARS = frozenset({
         R['\\'], R[':'], R['*'], R['?'], R['|'], R['"'], R['/'],  # Special character replacements
         '.', ' ', ',', ';', '-', '+', "'", '\u02bc',  # Standard word boundaries, including ASCII Apostrophe and Modifier Letter Apostrophe
         R['<'], R['>'],                  # Angle brackets
@@ -649,12 +753,15 @@ class FileRenamer:
         R['<'], R['<<'], R['[['], R['{{'],  # Replacement opening brackets
         R['>'], R['>>'], R[']]'], R['}}'],  # Replacement closing brackets
         '¿', '¡',                    # Spanish inverted punctuation marks
-    }
+    })
+
+    # Each boundary char mapped to whether it ends an abbreviation run (spaces and periods do)
+    _BOUNDARY_RESETS_ABBREV = MappingProxyType({char: char in ' .' for char in WORD_BOUNDARY_CHARS})
 
     # File extensions where we want to preserve the original case of the base name
     # Only includes extensions that might be included/imported/required by code
     # Should be all lowercase, no periods
-    PRESERVE_CASE_EXTENSIONS = {
+    PRESERVE_CASE_EXTENSIONS = frozenset({
         # Web
         'html', 'htm', 'css', 'js', 'jsx', 'ts', 'tsx', 'vue', 'php',
         # Programming
@@ -664,10 +771,10 @@ class FileRenamer:
         'ini', 'conf', 'cfg', 'env',
         # Build
         'make', 'cmake', 'gradle', 'pom',
-    }
+    })
 
     # Known file extensions that should be recognized and moved
-    KNOWN_EXTENSIONS = PRESERVE_CASE_EXTENSIONS | {
+    KNOWN_EXTENSIONS = frozenset(PRESERVE_CASE_EXTENSIONS | {
         # Basic text and documents
         'txt', 'rtf', 'pdf',
         'doc', 'docx', 'xls', 'xlsx', 'ppt', 'pptx',  # Microsoft Office
@@ -686,10 +793,10 @@ class FileRenamer:
         'eml', 'msg',
         # Font
         'ttf', 'otf', 'woff', 'woff2',
-    }
+    })
 
     # Common contractions and possessives to preserve
-    CONTRACTIONS = {
+    CONTRACTIONS = frozenset({
         # Contractions (without apostrophe)
         'll',  # will, shall
         's',   # is, has, possessive
@@ -704,7 +811,7 @@ class FileRenamer:
         'til', # until (informal)
         'n',   # and (rock'n'roll)
         'cause', # because
-    }
+    })
 
     # Common abbreviations to preserve
     @classmethod
@@ -718,11 +825,11 @@ class FileRenamer:
         cleaned = abbr.strip()
 
         # First remove periods for comparison with our abbreviations list
-        abbr_without_periods = re.sub(r'\.', '', cleaned)
+        abbr_without_periods = cleaned.replace('.', '')
 
         # Check if it's in our known abbreviations list or standalone units list (case-insensitive)
-        if (abbr_without_periods.upper() in [a.upper() for a in cls.ABBREVIATIONS] or
-            abbr_without_periods.upper() in [u.upper() for u in cls.STANDALONE_UNITS]):
+        abbr_upper = abbr_without_periods.upper()
+        if abbr_upper in cls._ABBREVIATIONS_BY_UPPER or abbr_upper in cls._STANDALONE_UNITS_UPPER:
             return abbr_without_periods  # Return version without periods
         else:
             # For regular words, just preserve them as is (periods will be handled elsewhere)
@@ -737,30 +844,22 @@ class FileRenamer:
         the text is split into tokens for further processing.
         """
 
-        # Patterns for letter-based abbreviations with periods
-        # We'll use multiple patterns to handle different cases
-
-        # Pattern 1: Multi-letter abbreviations with periods (M.D., Ph.D., B.Sc., M.Phil.)
-        pattern1 = r'(?:^|(?<=\W))([A-Za-z]+(?:\.[A-Za-z]+)+\.?)(?=\W|$)'
-
-        # Pattern 2: Abbreviations with periods and internal spaces (e.g. 'Lt. Col.', 'Prof. Dr.')
-        # Process this BEFORE pattern 3 to catch multi-part abbreviations
-        pattern2 = r'(?:^|(?<=\W))([A-Za-z][A-Za-z]*\. [A-Za-z][A-Za-z0-9]*\.)(?=\W|$)'
-
-        # Pattern 3: Common abbreviations with trailing period (Dr., Mr., Ms., etc.)
-        # Only match short words (1-3 letters) to avoid matching regular words with periods
-        pattern3 = r'(?:^|(?<=\W))([A-Za-z]{1,3}\.)(?=\s|$)'
+        # Every abbreviation pattern needs a period, so most names can skip the regex work
+        if '.' not in text:
+            return text
 
         # Initialize result with the original text
         result = text
+        debug = logger.isEnabledFor(logging.DEBUG)
 
         # Process each pattern in sequence
-        for i, pattern in enumerate([pattern1, pattern2, pattern3]):
+        for i, pattern in enumerate(self._ABBREVIATION_PATTERNS):
             # Find all matches for this pattern
-            pattern_matches = list(re.finditer(pattern, result, flags=re.IGNORECASE))
+            pattern_matches = list(pattern.finditer(result))
 
             if pattern_matches:
-                self.debug_print(f"[ABBREV] Pattern {i+1} matches ({len(pattern_matches)}):", level='verbose')
+                if debug:
+                    self.debug_print(f"[ABBREV] Pattern {i+1} matches ({len(pattern_matches)}):", level='verbose')
 
                 # Process each match
                 for match in pattern_matches:
@@ -774,7 +873,8 @@ class FileRenamer:
 
                     # Clean the abbreviation
                     cleaned_abbr = self._clean_abbreviation(match_text)
-                    self.debug_print(f"[ABBREV] Original abbreviation: {match_text!r}, cleaned: {cleaned_abbr!r}", level='verbose')
+                    if debug:
+                        self.debug_print(f"[ABBREV] Original abbreviation: {match_text!r}, cleaned: {cleaned_abbr!r}", level='verbose')
 
                     # Skip if cleaning returned None
                     if cleaned_abbr is None:
@@ -795,12 +895,13 @@ class FileRenamer:
                 # self.debug_print(f"[ABBREV] Pattern {i+1}: No matches found", level='verbose')
 
         # Show if any changes were made
-        if result != text:
-            self.debug_print(f"[ABBREV] Changed: {text!r} -> {result!r}", level='verbose')
-        # else:
-            # self.debug_print(f"[ABBREV] No changes made to text", level='verbose')
+        if debug:
+            if result != text:
+                self.debug_print(f"[ABBREV] Changed: {text!r} -> {result!r}", level='verbose')
+            # else:
+                # self.debug_print(f"[ABBREV] No changes made to text", level='verbose')
 
-        self.debug_print(f"[ABBREV] Preprocessing complete, result: {result!r}", level='verbose')
+            self.debug_print(f"[ABBREV] Preprocessing complete, result: {result!r}", level='verbose')
         return result
 
     def _replace_special_chars(self, text):
@@ -813,36 +914,42 @@ class FileRenamer:
         Returns:
             Text with special characters replaced
         """
-        # Function to colorize replacement chars for debug output
-        def colorize(char):
-            return f"{Fore.CYAN}{char}{Style.RESET_ALL}"
-
         # Handle fractions first (digit/digit with optional spaces)
-        text = re.sub(r'(\d)\s*/\s*(\d)', fr'\1{self.R["/"]}\2', text)
-
-        # Handle multi-char sequences (like ellipsis, brackets)
-        for original_char, replacement_char in self.CHAR_REPLACEMENTS.items():
-            if len(original_char) > 1:  # Multi-char replacement
-                if original_char in text:
-                    self.debug_print(f"  Replace: '{original_char}' → '{colorize(replacement_char)}'", level='detail')
-                    if original_char == '...':
-                        # Handle ellipsis specially to match 3 or more dots
-                        text = re.sub(r'\.{3,}', replacement_char, text)
-                    else:
-                        text = text.replace(original_char, replacement_char)
+        text = self._FRACTION_RE.sub(self._FRACTION_REPL, text)
 
-        # Handle single-char replacements
-        for original_char, replacement_char in self.CHAR_REPLACEMENTS.items():
-            if len(original_char) == 1:  # Single-char replacements
-                if original_char in text:
-                    self.debug_print(f"  Replace: '{original_char}' → '{colorize(replacement_char)}'", level='detail')
-                    text = re.sub(f'{re.escape(original_char)}+', replacement_char, text)
+        # Handle multi-char sequences (like ellipsis, brackets) and single-char replacements in one pass
+        if logger.isEnabledFor(DETAIL):
+            for match in self._MULTI_CHAR_RE.finditer(text):
+                self.debug_print(f"  Replace: '{match.group(0)}' → '{self.colorize_replacements(self._multi_char_replacement(match))}'", level='detail')
+        text = self.apply_char_replacements(text)
 
         # Handle repeated characters that aren't illegal but should be collapsed
         text = self._collapse_repeated_characters(text)
 
         return text
 
+    @classmethod
+    def _multi_char_replacement(cls, match):
+        """Return the CHAR_REPLACEMENTS value for a match of _MULTI_CHAR_RE."""
+        repeated_char = match.group(1)
+        if repeated_char:
+            return cls.CHAR_REPLACEMENTS[repeated_char]
+        # 4+ periods are still an ellipsis
+        matched = match.group(0)
+        return cls.CHAR_REPLACEMENTS[matched[:3] if matched[0] == '.' else matched]
+
+    @classmethod
+    def apply_char_replacements(cls, text):
+        """
+        Replace all CHAR_REPLACEMENTS keys in text.
+
+        Multi-char sequences and runs of the same character are replaced first by
+        _MULTI_CHAR_RE, then the remaining single characters by str.translate.
+        """
+        if cls._REPLACEMENT_FIRST_CHARS.isdisjoint(text):
+            return text
+        return cls._MULTI_CHAR_RE.sub(cls._multi_char_replacement, text).translate(cls._TRANSLATE_TABLE)
+
     def _collapse_repeated_characters(self, text):
         """
         Replace sequences of repeated characters with appropriate replacements.
@@ -859,61 +966,33 @@ class FileRenamer:
         Returns:
             Modified text with repeated characters handled
         """
-        # Handle characters with specific replacements
-        for char, (min_repeats, replacement) in self.CHARS_TO_COLLAPSE.items():
-            pattern = f'{re.escape(char)}{{{min_repeats},}}'
-            if replacement is None:
-                # Collapse to a single instance of the original character
-                if re.search(pattern, text):
-                    self.debug_print(f"  Collapse: '{char * min_repeats}+' → '{char}'", level='detail')
-                    text = re.sub(pattern, char, text)
-            else:
-                # Replace with the specified replacement
-                if re.search(pattern, text):
-                    self.debug_print(f"  Replace: '{char * min_repeats}+' → '{self.colorize(replacement)}'", level='detail')
-                    text = re.sub(pattern, replacement, text)
-
-        # Handle emojis (more complex pattern)
-        emoji_pattern = re.compile(
-            "["
-            "\U0001F600-\U0001F64F"  # emoticons
-            "\U0001F300-\U0001F5FF"  # symbols & pictographs
-            "\U0001F680-\U0001F6FF"  # transport & map symbols
-            "\U0001F700-\U0001F77F"  # alchemical symbols
-            "\U0001F780-\U0001F7FF"  # Geometric Shapes
-            "\U0001F800-\U0001F8FF"  # Supplemental Arrows-C
-            "\U0001F900-\U0001F9FF"  # Supplemental Symbols and Pictographs
-            "\U0001FA00-\U0001FA6F"  # Chess Symbols
-            "\U0001FA70-\U0001FAFF"  # Symbols and Pictographs Extended-A
-            "\U00002702-\U000027B0"  # Dingbats
-            "\U000024C2-\U0001F251"
-            "]"
-        )
-
-        # Find all emoji sequences in the text
-        for match in re.finditer(r'((' + emoji_pattern.pattern + r')\2+)', text):
-            full_match = match.group(1)
-            single_emoji = match.group(2)
-            if full_match != single_emoji:  # Only replace if there are actually repeats
-                self.debug_print(f"  Collapse emoji: '{full_match}' → '{single_emoji}'", level='detail')
-                text = text.replace(full_match, single_emoji)
+        # Handle characters with specific replacements, all in one pass
+        if logger.isEnabledFor(DETAIL):
+            for match in self._COLLAPSE_RE.finditer(text):
+                self.debug_print(f"  Collapse: '{match.group(0)}' → '{self.colorize(self._collapsed_run(match))}'", level='detail')
+        text = self._COLLAPSE_RE.sub(self._collapsed_run, text)
+
+        # Handle emojis; every emoji range is outside ASCII
+        if text.isascii():
+            return text
+        if logger.isEnabledFor(DETAIL):
+            for match in self._EMOJI_RUN_RE.finditer(text):
+                self.debug_print(f"  Collapse emoji: '{match.group(1)}' → '{match.group(2)}'", level='detail')
+        text = self._EMOJI_RUN_RE.sub(r'\2', text)
 
         return text
 
-    def _preserve_special_terms(self, text):
-        """
-        Preserve terms with specific capitalization and punctuation by replacing them with
-        temporary markers before text splitting. This ensures terms like TV-MA, AT&T, etc.
-        are treated as single tokens rather than being split at punctuation characters.
-
-        The preserved terms are first processed with the same character replacements
-        as the filename, so users can specify terms with original characters.
-
-        Args:
-            text: Text to process (already processed with character replacements)
+    @classmethod
+    def _collapsed_run(cls, match):
+        """Return the replacement for a run of a CHARS_TO_COLLAPSE character matched by _COLLAPSE_RE."""
+        char = match.group(0)[0]
+        replacement = cls.CHARS_TO_COLLAPSE[char][1]
+        return char if replacement is None else replacement
 
-        Returns:
-            Text with preserved terms replaced by markers
+    def _build_preserved_term_tables(self):
+        """
+        Build the marker tables and compiled match patterns for PRESERVED_TERMS
+        used by _preserve_special_terms and _restore_preserved_terms.
         """
         # Create a unique marker for each term
         self._preserved_term_markers = {}
@@ -942,7 +1021,7 @@ class FileRenamer:
             self._preserved_term_originals[marker] = cleaned_term  # Store cleaned version
 
             # Create normalized version (lowercase, no spaces or punctuation)
-            normalized = re.sub(r'[\s\-.,;:"&!?()]', '', cleaned_term.lower())
+            normalized = self._TERM_PUNCTUATION_RE.sub('', cleaned_term.lower())
             self._normalized_terms[normalized] = (cleaned_term, marker)
 
             # Store mapping between original and cleaned terms
@@ -968,20 +1047,25 @@ class FileRenamer:
         for orig, cleaned in self._cleaned_terms.items():
             self.debug_print(f"  {orig!r} → {cleaned!r}", level='detail')
 
-        # First try exact matches (case-insensitive)
-        for term in self._cleaned_terms.values():  # Use cleaned terms for matching
-            # Replace the term with its marker
-            new_text = re.sub(rf'\b{re.escape(term)}\b', self._preserved_term_markers[term], text, flags=re.IGNORECASE)
-            if new_text != text:
-                self.debug_print(f"[PRESERVED] Exact match: {term!r} in text", level='verbose')
-                text = new_text
+        # Hash lookups for the per-part checks in _clean_filename
+        self._preserved_terms_set = frozenset(self.PRESERVED_TERMS)
+        self._preserved_period_terms = {
+            term: term.replace('.', self._PRESERVED_PERIOD_PLACEHOLDER)
+            for term in self.PRESERVED_TERMS if '.' in term
+        }
 
-        # Then try flexible matching for each preserved term
-        # This handles variations in spacing, punctuation, and capitalization
-        for orig_term, term in self._cleaned_terms.items():
+        # Exact match patterns, in the order of the cleaned terms
+        self._exact_term_patterns = [
+            (term, re.compile(rf'\b{re.escape(term)}\b', re.IGNORECASE), self._preserved_term_markers[term])
+            for term in self._cleaned_terms.values()
+        ]
+
+        # Flexible patterns for multi-word terms
+        self._flexible_term_patterns = []
+        for term in self._cleaned_terms.values():
             # Skip single-word terms as they're already handled by exact matching
             # Check for any word boundary characters using WORD_BOUNDARY_CHARS
-            if not any(char in term for char in self.WORD_BOUNDARY_CHARS):
+            if self.WORD_BOUNDARY_CHARS.isdisjoint(term):
                 continue
 
             # Get the normalized form of the term (lowercase, no spaces or punctuation)
@@ -990,9 +1074,7 @@ class FileRenamer:
 
             # Create a pattern that allows flexible spacing and punctuation between words
             # Split the term into words using WORD_BOUNDARY_CHARS as delimiters
-            # Create a regex pattern for splitting based on WORD_BOUNDARY_CHARS
-            split_pattern = f"[{''.join(re.escape(char) for char in self.WORD_BOUNDARY_CHARS)}]+"
-            words = re.split(split_pattern, term)
+            words = self._WORD_BOUNDARY_RUN_RE.split(term)
             # Filter out empty strings from the split result
             words = [word for word in words if word]
 
@@ -1009,32 +1091,69 @@ class FileRenamer:
                 # Allow optional trailing punctuation
                 pattern += r'[\s\-.,;:"&!?()]*'
 
-                # Find all matches of this pattern
-                matches = re.findall(pattern, text, flags=re.IGNORECASE)
+                self._flexible_term_patterns.append(
+                    (term, re.compile(pattern, re.IGNORECASE), normalized_term, self._preserved_term_markers[term]))
+
+    def _preserve_special_terms(self, text):
+        """
+        Preserve terms with specific capitalization and punctuation by replacing them with
+        temporary markers before text splitting. This ensures terms like TV-MA, AT&T, etc.
+        are treated as single tokens rather than being split at punctuation characters.
+
+        The preserved terms are first processed with the same character replacements
+        as the filename, so users can specify terms with original characters.
+
+        Args:
+            text: Text to process (already processed with character replacements)
+
+        Returns:
+            Text with preserved terms replaced by markers
+        """
+        # The term tables and patterns depend only on PRESERVED_TERMS and the replacement
+        # tables, so they are built once rather than for every filename
+        key = (tuple(self.PRESERVED_TERMS), self.CHAR_REPLACEMENTS)
+        if key != getattr(self, '_preserved_terms_key', None):
+            self._build_preserved_term_tables()
+            self._preserved_terms_key = key
 
-                for match in matches:
-                    # Normalize the match for comparison using the consistent pattern
-                    normalized_match = self._normalization_pattern.sub('', match.lower())
+        # First try exact matches (case-insensitive)
+        for term, exact_re, marker in self._exact_term_patterns:  # Use cleaned terms for matching
+            # Replace the term with its marker
+            new_text = exact_re.sub(marker, text)
+            if new_text != text:
+                self.debug_print(f"[PRESERVED] Exact match: {term!r} in text", level='verbose')
+                text = new_text
+
+        # Then try flexible matching for each multi-word preserved term
+        # This handles variations in spacing, punctuation, and capitalization
+        for term, flexible_re, normalized_term, marker in self._flexible_term_patterns:
+            # Find all matches of this pattern
+            matches = flexible_re.findall(text)
 
-                    # Check if the normalized match is exactly the normalized term
-                    if normalized_match == normalized_term:
-                        # Replace with the preserved term marker
-                        text = text.replace(match, self._preserved_term_markers[term])
-                        self.debug_print(f"[PRESERVED] Flexible match: {match!r} → {term!r}", level='verbose')
+            for match in matches:
+                # Normalize the match for comparison using the consistent pattern
+                normalized_match = self._normalization_pattern.sub('', match.lower())
+
+                # Check if the normalized match is exactly the normalized term
+                if normalized_match == normalized_term:
+                    # Replace with the preserved term marker
+                    text = text.replace(match, marker)
+                    self.debug_print(f"[PRESERVED] Flexible match: {match!r} → {term!r}", level='verbose')
 
         # General approach for all terms - check for normalized matches in word groups
         # Use a pattern that captures word groups more effectively
         # This pattern handles words at the beginning/end of text and with special characters
-        # Create a pattern based on WORD_BOUNDARY_CHARS that captures word groups
-        boundary_chars = ''.join(re.escape(char) for char in self.WORD_BOUNDARY_CHARS)
-        word_pattern = f"(?:^|[{boundary_chars}])([^{boundary_chars}]+)(?:[{boundary_chars}]|$)"
-        words = re.findall(word_pattern, text)
-        self.debug_print(f"[PRESERVED] Found {len(words)} word groups to check", level='detail')
+        # Pattern based on WORD_BOUNDARY_CHARS that captures word groups, built in _class_init
+        words = self._WORD_GROUP_RE.findall(text)
+        detail = logger.isEnabledFor(DETAIL)
+        if detail:
+            self.debug_print(f"[PRESERVED] Found {len(words)} word groups to check", level='detail')
 
         for word_group in words:
             # Normalize the word group using the consistent normalization pattern
             normalized_group = self._normalization_pattern.sub('', word_group.lower())
-            self.debug_print(f"[PRESERVED] Checking: {word_group!r} → Normalized: {normalized_group!r}", level='detail')
+            if detail:
+                self.debug_print(f"[PRESERVED] Checking: {word_group!r} → Normalized: {normalized_group!r}", level='detail')
 
             # Check if this normalized group exactly matches any of our terms
             if normalized_group in self._normalized_terms and len(normalized_group) > 2:  # Minimum length check
@@ -1096,18 +1215,20 @@ class FileRenamer:
 
             # Process each part individually to maintain part structure
             restored_parts = []
+            detail = logger.isEnabledFor(DETAIL)
             for i, part in enumerate(parts):
                 try:
                     # Process this part
                     processed_part = part
-                    self.debug_print(f"[RESTORATION] Processing part {i}: {part!r}", level='detail')
+                    if detail:
+                        self.debug_print(f"[RESTORATION] Processing part {i}: {part!r}", level='detail')
 
-                    # Check if this part contains any markers
-                    for marker in markers:
-                        if marker in processed_part:
-                            original = self._preserved_term_originals[marker]
-                            # Replace the marker with the original term
-                            processed_part = processed_part.replace(marker, original)
+                    # Check if this part contains any markers; they all share one prefix,
+                    # so most parts are ruled out with a single substring test
+                    if "__PRESERVED_TERM_" in processed_part:
+                        # Replace each marker with the original term (replace is a no-op if absent)
+                        for marker in markers:
+                            processed_part = processed_part.replace(marker, self._preserved_term_originals[marker])
 
                     # Add the processed part to the result
                     restored_parts.append(processed_part)
@@ -1131,15 +1252,6 @@ class FileRenamer:
         This preprocessing step handles date patterns with periods before
         the text is split into tokens for further processing.
         """
-        # Pattern 1: number.month.number (12.Jan.2025)
-        pattern1 = r'\b(\d{1,4})\.([A-Za-z]{3,})\.?(\d{1,4})?\b'
-        # Pattern 2: month.number (Jan.2025) or month.number.number (Jan.12.2025)
-        pattern2 = r'\b([A-Za-z]{3,})\.?(\d{1,4})(\.\d{1,4})?\b'
-        # Pattern 3: number.number.month (2025.12.Jan)
-        pattern3 = r'\b(\d{1,4})\.(\d{1,4})\.([A-Za-z]{3,})\b'
-        # Pattern 4: month.month.year (Jan.Feb.2025) - for date ranges
-        pattern4 = r'\b([A-Za-z]{3,})\.([A-Za-z]{3,})\.?(\d{1,4})?\b'
-
         def replace_date(match, format_type):
             if format_type == 1:  # number.month.number or number.month
                 day_or_year = match.group(1)
@@ -1189,17 +1301,22 @@ class FileRenamer:
             # If not a valid month pattern or format, return unchanged
             return match.group(0)
 
-        # Apply each pattern
-        text = re.sub(pattern1, lambda m: replace_date(m, 1), text)
-        text = re.sub(pattern2, lambda m: replace_date(m, 2), text)
-        text = re.sub(pattern3, lambda m: replace_date(m, 3), text)
-        text = re.sub(pattern4, lambda m: replace_date(m, 4), text)
+        # Apply each pattern (see _DATE_PATTERNS for formats 1-4)
+        # Formats 1-3 need a digit and formats 1, 3 and 4 need a period, so skip passes that can't match.
+        # (Each pass must still run on its own: a non-month match consumes text the next pass won't see.)
+        has_digit = self._DIGITS_RE.search(text) is not None
+        for format_type, pattern in enumerate(self._DATE_PATTERNS, 1):
+            if (format_type != 4 and not has_digit) or (format_type != 2 and '.' not in text):
+                continue
+            text = pattern.sub(lambda m: replace_date(m, format_type), text)
 
         return text
 
 
     # Common units in filenames that need specific capitalization
     R = CHAR_REPLACEMENTS  # Shorthand for readability
+    # Rates (30/hr): _compact_per_unit drops spaces around the slash and uses the slash replacement
+    _PER_UNIT_TABLE = str.maketrans({'/': R['/']})
     UNIT_PATTERNS = {
         # Weight units (no space, preserve case)
         r'\d+mg\b': lambda s: f"{s}",  # 5mg -> 5mg
@@ -1300,23 +1417,18 @@ class FileRenamer:
         # Hours
         r'\b\d*\s*hr\b': lambda s: f"{s}",  # 24hr -> 24hr, hr -> hr
         r'\b\d*\s*h\b': lambda s: f"{s}",   # 24h -> 24h, h -> h
-        r'\b\d*\s*/\s*hr\b': lambda s: re.sub(r'(\d*)\s*/\s*hr',
-            lambda m: f"{m.group(1)}{R['/']}hr", s),  # 30/hr -> 30⧸hr, /hr -> ⧸hr
-        r'\b\d*\s*/\s*h\b': lambda s: re.sub(r'(\d*)\s*/\s*h',
-            lambda m: f"{m.group(1)}{R['/']}h", s),   # 30/h -> 30⧸h, /h -> ⧸h
+        r'\b\d*\s*/\s*hr\b': _compact_per_unit,  # 30/hr -> 30⧸hr, /hr -> ⧸hr
+        r'\b\d*\s*/\s*h\b': _compact_per_unit,   # 30/h -> 30⧸h, /h -> ⧸h
 
         # Minutes
         r'\b\d*\s*min\b': lambda s: f"{s}",  # 15min -> 15min, min -> min
-        r'\b\d*\s*/\s*min\b': lambda s: re.sub(r'(\d*)\s*/\s*min',
-            lambda m: f"{m.group(1)}{R['/']}min", s),  # 30/min -> 30⧸min, /min -> ⧸min
+        r'\b\d*\s*/\s*min\b': _compact_per_unit,  # 30/min -> 30⧸min, /min -> ⧸min
 
         # Seconds
         r'\b\d*\s*sec\b': lambda s: f"{s}",  # 30sec -> 30sec, sec -> sec
         r'\b\d*\s*s\b': lambda s: f"{s}",    # 30s -> 30s, s -> s
-        r'\b\d*\s*/\s*sec\b': lambda s: re.sub(r'(\d*)\s*/\s*sec',
-            lambda m: f"{m.group(1)}{R['/']}sec", s),  # 30/sec -> 30⧸sec, /sec -> ⧸sec
-        r'\b\d*\s*/\s*s\b': lambda s: re.sub(r'(\d*)\s*/\s*s',
-            lambda m: f"{m.group(1)}{R['/']}s", s),    # 30/s -> 30⧸s, /s -> ⧸s
+        r'\b\d*\s*/\s*sec\b': _compact_per_unit,  # 30/sec -> 30⧸sec, /sec -> ⧸sec
+        r'\b\d*\s*/\s*s\b': _compact_per_unit,    # 30/s -> 30⧸s, /s -> ⧸s
 
         # Days, Weeks, Months, Years
         r'\b\d*\s*d\b': lambda s: f"{s}",    # 30d -> 30d, d -> d
@@ -1324,20 +1436,15 @@ class FileRenamer:
         r'\b\d*\s*mo\b': lambda s: f"{s}",  # 12mo -> 12mo, mo -> mo
         r'\b\d*\s*yr\b': lambda s: f"{s}",  # 10yr -> 10yr, yr -> yr
 
-        r'\b\d*\s*/\s*d\b': lambda s: re.sub(r'(\d*)\s*/\s*d',
-            lambda m: f"{m.group(1)}{R['/']}d", s),    # 30/d -> 30⧸d, /d -> ⧸d
-        r'\b\d*\s*/\s*wk\b': lambda s: re.sub(r'(\d*)\s*/\s*wk',
-            lambda m: f"{m.group(1)}{R['/']}wk", s),  # 52/wk -> 52⧸wk, /wk -> ⧸wk
-        r'\b\d*\s*/\s*mo\b': lambda s: re.sub(r'(\d*)\s*/\s*mo',
-            lambda m: f"{m.group(1)}{R['/']}mo", s),  # 12/mo -> 12⧸mo, /mo -> ⧸mo
-        r'\b\d*\s*/\s*yr\b': lambda s: re.sub(r'(\d*)\s*/\s*yr',
-            lambda m: f"{m.group(1)}{R['/']}yr", s),  # 10/yr -> 10⧸yr, /yr -> ⧸yr
+        r'\b\d*\s*/\s*d\b': _compact_per_unit,    # 30/d -> 30⧸d, /d -> ⧸d
+        r'\b\d*\s*/\s*wk\b': _compact_per_unit,  # 52/wk -> 52⧸wk, /wk -> ⧸wk
+        r'\b\d*\s*/\s*mo\b': _compact_per_unit,  # 12/mo -> 12⧸mo, /mo -> ⧸mo
+        r'\b\d*\s*/\s*yr\b': _compact_per_unit,  # 10/yr -> 10⧸yr, /yr -> ⧸yr
     }
 
 
 
     # Debug mode flag
-    _debug_level = get_debug_level()
     _debug = False  # Initialize debug flag for command line use
 
     @classmethod
@@ -1347,11 +1454,16 @@ class FileRenamer:
         - Green for non-ASCII characters not in CHAR_REPLACEMENTS
         - no coloring for ASCII characters
         """
-        if char in cls.CHAR_REPLACEMENTS.values():
+        if char.isascii() and char not in cls._REPLACEMENT_VALUES:
+            return char  # Common case, checked first
+        if char in cls._REPLACEMENT_VALUES:
             return f"{Fore.CYAN}{char}{Style.RESET_ALL}"
-        elif ord(char) > 127:  # Non-ASCII character
-            return f"{Fore.GREEN}{char}{Style.RESET_ALL}"
-        return char
+        return f"{Fore.GREEN}{char}{Style.RESET_ALL}"  # Non-ASCII character
+
+    @classmethod
+    def colorize_replacements(cls, text):
+        """Colorize every CHAR_REPLACEMENTS character in text cyan, in one regex pass."""
+        return cls._REPLACEMENT_VALUES_RE.sub(cls._CYAN_MATCH, text)
 
     @classmethod
     def debug_print(cls, *args, level='normal', **kwargs):
@@ -1360,9 +1472,7 @@ class FileRenamer:
         Args:
             level: Required debug level ('normal' or 'detail')
         """
-        if cls._debug_level == 'off':
-            return
-        if level == 'detail' and cls._debug_level != 'detail':
+        if not logger.isEnabledFor(DETAIL if level == 'detail' else logging.DEBUG):
             return
         print(*args, **kwargs)
 
@@ -1402,7 +1512,8 @@ class FileRenamer:
     def _validate_abbreviations(cls):
         """
         Validate and clean the ABBREVIATIONS set according to our rules.
-        Modifies ABBREVIATIONS in place.
+        Replaces ABBREVIATIONS with a new frozenset of the cleaned abbreviations.
+        Called once per process from _class_init, not on every FileRenamer construction.
 
         This method directly cleans each abbreviation by:
         1. Removing leading and trailing whitespace
@@ -1415,7 +1526,7 @@ class FileRenamer:
             abbr_stripped = abbr.strip()
 
             # Remove all periods
-            cleaned_abbr = re.sub(r'\.', '', abbr_stripped)
+            cleaned_abbr = abbr_stripped.replace('.', '')
 
             # Debug output
             if abbr != cleaned_abbr:
@@ -1425,7 +1536,7 @@ class FileRenamer:
             cleaned.add(cleaned_abbr)
 
         # Replace the original set with the cleaned set
-        cls.ABBREVIATIONS = cleaned
+        cls.ABBREVIATIONS = frozenset(cleaned)
 
     def __init__(self, directory: str = '.', dry_run: bool = False, settings_path: Optional[str] = None):
         """
@@ -1436,8 +1547,8 @@ class FileRenamer:
             dry_run (bool): If True, only show what would be renamed without making changes
             settings_path (str, optional): Path to settings file
         """
-        # Validate and clean abbreviations first
-        self._validate_abbreviations()
+        # One-time class setup: abbreviation cleaning, month patterns, split pattern
+        type(self)._class_init()
 
         # Load user settings
         self.user_abbreviations, self.user_preserved_terms = self.load_user_settings(settings_path)
@@ -1449,30 +1560,84 @@ class FileRenamer:
         # Add user settings to the existing arrays
         if self.user_abbreviations:
             # self.debug_print(f"Adding {len(self.user_abbreviations)} user abbreviations", level='normal')
-            self.ABBREVIATIONS.update(self.user_abbreviations)
+            type(self).ABBREVIATIONS = self.ABBREVIATIONS | self.user_abbreviations
+            self._index_abbreviations()
 
         if self.user_preserved_terms:
             # self.debug_print(f"Adding {len(self.user_preserved_terms)} user preserved terms", level='normal')
             self.PRESERVED_TERMS.extend(self.user_preserved_terms)
 
-        self.directory = Path(directory)
+        self.directory = directory if isinstance(directory, Path) else Path(directory)
         self.dry_run = dry_run
 
+        # Memo of _clean_filename (filename -> cleaned name), so repeated names (e.g. across
+        # directories) are cleaned once. It holds only strings, no reference back to self
+        self._clean_memo = {}
+        self._clean_memo_key = self._config_key()
+
+    def _config_key(self) -> tuple:
+        """Hashable snapshot of the settings cleaned names depend on; a change invalidates the memo"""
+        return (tuple(self.CHAR_REPLACEMENTS.items()), frozenset(self.ABBREVIATIONS), tuple(self.PRESERVED_TERMS))
+
+    def _memo_clean_filename(self, filename: str) -> str:
+        """_clean_filename through the memo, dropping the oldest entry when it is full"""
+        memo = self._clean_memo
+        cleaned = memo.get(filename)
+        if cleaned is None:
+            cleaned = self._clean_filename(filename)
+            if len(memo) >= self._MEMO_SIZE:
+                del memo[next(iter(memo))]
+            memo[filename] = cleaned
+        return cleaned
+
+    def _cleaner(self):
+        """
+        Return the function that cleans one name: the memo, or _clean_filename itself when debugging
+        (so repeated names still show their trace).
+
+        If CHAR_REPLACEMENTS, ABBREVIATIONS or PRESERVED_TERMS changed (replaced or edited in place),
+        the memo, computed from the old settings, is dropped.
+        """
+        config_key = self._config_key()
+        if config_key != self._clean_memo_key:
+            self._clean_memo.clear()
+            self._clean_memo_key = config_key
+        return self._clean_filename if logger.isEnabledFor(logging.DEBUG) else self._memo_clean_filename
+
+    @classmethod
+    def _class_init(cls):
+        """
+        Derive the class-level lookup data shared by all instances.
+
+        Runs once; later FileRenamer constructions return immediately.
+        """
+        if cls._initialized:
+            return
+
+        # Check the replacement table once per process, here rather than at import time
+        cls.validate_replacements()
+
+        # Validate and clean abbreviations first
+        cls._validate_abbreviations()
+
         # Define word boundary delimiters
-        self.delimiters = [' ', '.', '-']
+        cls.delimiters = [' ', '.', '-']
 
-        # Build the split pattern from delimiters and single-char replacements
-        special_chars = [replacement_char for original_char, replacement_char in self.CHAR_REPLACEMENTS.items()
-            if len(replacement_char) == 1]  # Only single-char replacements
-        split_chars = self.delimiters + special_chars
-        self.split_pattern = f"([{''.join(re.escape(c) for c in split_chars)}])"
-        self.special_chars = set(special_chars)  # For faster lookups
+        cls._build_replacement_tables()
+
+        # Compiled once for splitting filenames and preserved terms on WORD_BOUNDARY_CHARS
+        boundary_chars = ''.join(re.escape(c) for c in cls.WORD_BOUNDARY_CHARS)
+        cls._WORD_BOUNDARY_SPLIT_RE = re.compile(f"([{boundary_chars}])")  # Keeps the boundary chars as parts
+        cls._WORD_BOUNDARY_RUN_RE = re.compile(f"[{boundary_chars}]+")
+        cls._WORD_GROUP_RE = re.compile(f"(?:^|[{boundary_chars}])([^{boundary_chars}]+)(?:[{boundary_chars}]|$)")
 
         # Month names and abbreviations must be in ABBREVIATIONS to handle dates with separators:
         #   25-Jan-12 -> split into ['25', '-', 'jan', '-', '12'] and 'jan' -> 'Jan'
         #   25.Jan.12 -> split into ['25', '.', 'jan', '.', '12'] and 'jan' -> 'Jan'
         # Cannot move these to UNIT_PATTERNS because separators break the pattern matching
-        self.ABBREVIATIONS.update(proper for _, proper in self.MONTH_FORMATS.items())
+        cls.ABBREVIATIONS = cls.ABBREVIATIONS.union(cls.MONTH_FORMATS.values())
+        cls._index_abbreviations()
+        cls._STANDALONE_UNITS_UPPER = frozenset(unit.upper() for unit in cls.STANDALONE_UNITS)
 
         # Add month patterns to UNIT_PATTERNS for dates without separators:
         #   2025jan12 -> stays as one word, need pattern to find/replace 'jan' -> 'Jan'
@@ -1480,15 +1645,121 @@ class FileRenamer:
         # Must handle these like other unit patterns (e.g. 5k -> 5K) to find/replace
         # the month part while preserving the surrounding numbers
         # Handle both formats: numbers before (2025jan12) and after (jan2025)
+        # All month patterns share one formatter that recases the month with _MONTH_RE
+        cls._MONTH_RE = re.compile(
+            '|'.join(sorted(cls.MONTH_FORMATS, key=len, reverse=True)), re.IGNORECASE)
         month_patterns = {}
-        for month, proper in self.MONTH_FORMATS.items():
+        for month in cls.MONTH_FORMATS:
             # Pattern for numbers before month (2025jan12)
-            month_patterns[f'\\d+{month}\\d*\\b'] = \
-                lambda s, m=month, p=proper: re.sub(m, p, s, flags=re.IGNORECASE)
+            month_patterns[f'\\d+{month}\\d*\\b'] = cls._format_month
             # Pattern for month before numbers (jan2025)
-            month_patterns[f'\\b{month}\\d+\\b'] = \
-                lambda s, m=month, p=proper: re.sub(m, p, s, flags=re.IGNORECASE)
-        self.UNIT_PATTERNS.update(month_patterns)
+            month_patterns[f'\\b{month}\\d+\\b'] = cls._format_month
+        cls.UNIT_PATTERNS.update(month_patterns)
+        cls._compile_unit_patterns()
+
+        cls._initialized = True
+
+    @classmethod
+    def _build_replacement_tables(cls):
+        """
+        Build the lookup tables derived from CHAR_REPLACEMENTS.
+
+        Runs from _class_init, and again from _refresh_tables when CHAR_REPLACEMENTS has been replaced.
+        """
+        replacements = cls.CHAR_REPLACEMENTS
+        single_chars = [original for original in replacements if len(original) == 1]
+        multi_chars = sorted((original for original in replacements if len(original) > 1), key=len, reverse=True)
+
+        cls._REPLACEMENT_VALUES = frozenset(replacements.values())
+        cls._DELETE_REPLACEMENTS_TABLE = str.maketrans(dict.fromkeys(cls._REPLACEMENT_VALUES))  # Removes every replacement char
+        # Any replacement char, for colorize_replacements (never matches if there are none)
+        cls._REPLACEMENT_VALUES_RE = re.compile(
+            '[' + ''.join(re.escape(char) for char in sorted(cls._REPLACEMENT_VALUES)) + ']' if cls._REPLACEMENT_VALUES else '(?!)')
+
+        # Single-char replacements are applied with str.translate in one C-level pass
+        cls._TRANSLATE_TABLE = str.maketrans({original: replacements[original] for original in single_chars})
+
+        # Regex for what translate can't do, applied first:
+        # multi-char sequences (longest first, ellipsis matches 3 or more periods),
+        # and runs of a repeated single character, which become one replacement character
+        cls._MULTI_CHAR_RE = re.compile('|'.join(
+            [r'\.{3,}' if original == '...' else re.escape(original) for original in multi_chars] +
+            (['([' + ''.join(re.escape(original) for original in single_chars) + r'])\1+'] if single_chars else [])
+        ) or '(?!)')
+
+        # Every replacement starts with one of these, so names without any can skip both passes
+        cls._REPLACEMENT_FIRST_CHARS = frozenset(original[0] for original in replacements)
+
+        # Replacement characters that are removed from the end of a filename
+        cls._DISALLOWED_TRAILING_REPLACEMENTS = cls._REPLACEMENT_VALUES - cls.ALLOWED_TRAILING_CHARS
+
+        # Everything _clean_trailing_chars removes from the end: periods, ellipses, disallowed replacements,
+        # and any whitespace between them
+        cls._TRAILING_TO_REMOVE = cls._DISALLOWED_TRAILING_REPLACEMENTS | {'.', '…'}
+        cls._TRAILING_RUN_RE = re.compile(
+            '[\\s' + ''.join(re.escape(c) for c in sorted(cls._TRAILING_TO_REMOVE)) + ']+\\Z')
+
+        # Build the split pattern from delimiters and single-char replacements
+        special_chars = [replacement_char for original_char, replacement_char in replacements.items()
+            if len(replacement_char) == 1]  # Only single-char replacements
+        split_chars = cls.delimiters + special_chars
+        cls.split_pattern = f"([{''.join(re.escape(c) for c in split_chars)}])"
+        cls.special_chars = frozenset(special_chars)  # For faster lookups
+
+        cls._replacement_tables_source = replacements
+
+    @classmethod
+    def _refresh_tables(cls):
+        """Rebuild the tables derived from CHAR_REPLACEMENTS or ABBREVIATIONS if either has been replaced."""
+        if cls.CHAR_REPLACEMENTS is not cls._replacement_tables_source:
+            cls._build_replacement_tables()
+        if cls.ABBREVIATIONS is not cls._abbreviation_index_source:
+            cls._index_abbreviations()
+
+    @classmethod
+    def _format_month(cls, text):
+        """Replace the month name in a date word like 2025jan12 with its MONTH_FORMATS case (2025Jan12)."""
+        return cls._MONTH_RE.sub(cls._month_case, text)
+
+    @classmethod
+    def _month_case(cls, match):
+        """Return the MONTH_FORMATS case for a month matched by _MONTH_RE."""
+        return cls.MONTH_FORMATS[match.group(0).lower()]
+
+    @classmethod
+    def _index_abbreviations(cls):
+        """
+        Map the uppercase form of each ABBREVIATIONS entry to the entry itself,
+        for case-insensitive lookups that return the case from ABBREVIATIONS.
+
+        When two entries differ only in case, the first one seen in the set wins,
+        the same one a scan of ABBREVIATIONS would have found.
+        """
+        abbreviations_by_upper = {}
+        for abbr in cls.ABBREVIATIONS:
+            abbreviations_by_upper.setdefault(abbr.upper(), abbr)
+        cls._ABBREVIATIONS_BY_UPPER = MappingProxyType(abbreviations_by_upper)
+        cls._abbreviation_index_source = cls.ABBREVIATIONS
+
+    @classmethod
+    def _compile_unit_patterns(cls):
+        """
+        Compile UNIT_PATTERNS once into a single alternation regex.
+
+        Each pattern is one named group, longest pattern first (the order they are tried in).
+        _UNIT_FORMATTERS maps each group's number to its (pattern, formatter) pair, so
+        match.lastindex picks the pair even if a pattern has capture groups of its own.
+        Formatters that return the unit unchanged are stored as None so they don't need to be called.
+        """
+        identity_code = (lambda s: f"{s}").__code__.co_code
+        unit_formatters = [
+            (pattern, None if formatter.__code__.co_code == identity_code else formatter)
+            for pattern, formatter in sorted(cls.UNIT_PATTERNS.items(), key=lambda x: len(x[0]), reverse=True)
+        ]
+        cls._UNIT_PATTERNS_RE = re.compile(
+            '|'.join(f'(?P<unit{i}>{pattern})' for i, (pattern, _) in enumerate(unit_formatters)), re.IGNORECASE)
+        group_numbers = cls._UNIT_PATTERNS_RE.groupindex
+        cls._UNIT_FORMATTERS = {group_numbers[f'unit{i}']: pair for i, pair in enumerate(unit_formatters)}
 
     def _check_abbreviation_with_context(self, current_part, titled_parts, is_last_part):
         """Check if current part and previous parts form an abbreviation.
@@ -1514,10 +1785,11 @@ class FileRenamer:
         # This allows periods and other chars to be part of abbreviation
         # But spaces/commas separate different abbreviations
         prev_parts = []
-        for part in titled_parts[::-1]:
-            if part in {' ', ','}:
+        for part in reversed(titled_parts):
+            if part == ' ' or part == ',':
                 break
-            prev_parts.insert(0, part)
+            prev_parts.append(part)
+        prev_parts.reverse()
         self.debug_print(f"    prev_parts collected: {prev_parts!r}")
 
         # Try combining with current part
@@ -1526,24 +1798,24 @@ class FileRenamer:
         self.debug_print(f"    combined={combined!r} cleaned={cleaned!r}")
 
         # Check if it forms a known abbreviation (case-insensitive)
-        for abbr in self.ABBREVIATIONS:
-            if cleaned.upper() == abbr.upper():
-                # Check if this should be a compound abbreviation
-                if prev_parts == ['.'] and len(titled_parts) >= 2 and titled_parts[-2] in self.ABBREVIATIONS:
-                    # Show state before combining
-                    self.debug_print(f"    Compound check: prev_parts={prev_parts!r} titled_parts={titled_parts!r} current={current_part!r}")
-                    # Combine with previous abbreviation
-                    first_abbrev = titled_parts[-2]
-                    titled_parts[-2] = first_abbrev + abbr
-                    # Remove the period
-                    titled_parts.pop(-1)
-                    self.debug_print(f"    ✓ Found compound abbreviation IN CONTEXT METHOD: {first_abbrev!r} + '.' + {abbr!r} -> {titled_parts[-2]!r}")
-                else:
-                    # Store as individual abbreviation
-                    titled_parts[-len(prev_parts):] = []
-                    titled_parts.append(abbr)
-                    self.debug_print(f"    ✓ Found abbreviation: {abbr!r} (titled_parts={titled_parts!r})")
-                return True
+        abbr = self._ABBREVIATIONS_BY_UPPER.get(cleaned.upper())
+        if abbr is not None:
+            # Check if this should be a compound abbreviation
+            if prev_parts == ['.'] and len(titled_parts) >= 2 and titled_parts[-2] in self.ABBREVIATIONS:
+                # Show state before combining
+                self.debug_print(f"    Compound check: prev_parts={prev_parts!r} titled_parts={titled_parts!r} current={current_part!r}")
+                # Combine with previous abbreviation
+                first_abbrev = titled_parts[-2]
+                titled_parts[-2] = first_abbrev + abbr
+                # Remove the period
+                titled_parts.pop(-1)
+                self.debug_print(f"    ✓ Found compound abbreviation IN CONTEXT METHOD: {first_abbrev!r} + '.' + {abbr!r} -> {titled_parts[-2]!r}")
+            else:
+                # Store as individual abbreviation
+                del titled_parts[-len(prev_parts):]
+                titled_parts.append(abbr)
+                self.debug_print(f"    ✓ Found abbreviation: {abbr!r} (titled_parts={titled_parts!r})")
+            return True
         return False
 
     def final_quote_processing(self, filename):
@@ -1560,20 +1832,9 @@ class FileRenamer:
         Note: Currently all remaining quotes default to APOSTROPHE_REPLACEMENT for
         consistent spacing. More sophisticated left/right quote handling may be added later.
         """
-        # Convert ASCII apostrophes to APOSTROPHE_REPLACEMENT
-        filename = filename.replace(self.ASCII_APOSTROPHE, self.APOSTROPHE_REPLACEMENT)
-
-        # Convert any other quote-like chars (except preserved ones)
-        preserved_chars = {
-            self.LEFT_SINGLE_QUOTE,      # Keep original left quotes
-            self.MODIFIER_LETTER_APOSTROPHE,  # Keep existing apostrophes (original or from contractions)
-        }
-
-        # Any remaining quote-like chars become APOSTROPHE_REPLACEMENT
-        for char in self.QUOTE_LIKE_CHARS - preserved_chars:
-            filename = filename.replace(char, self.APOSTROPHE_REPLACEMENT)
-
-        return filename
+        # Convert ASCII apostrophes and any other quote-like chars (except preserved ones)
+        # to APOSTROPHE_REPLACEMENT in one pass
+        return filename.translate(self._QUOTES_TO_APOSTROPHE_TABLE)
 
     def _clean_trailing_chars(self, text: str, debug_prefix: str = '') -> str:
         """Clean trailing special characters from text.
@@ -1585,54 +1846,48 @@ class FileRenamer:
         Returns:
             Cleaned text with trailing special characters removed
         """
-        while text:
-            changed = False
-
-            # First handle periods and ellipsis which have special "truly trailing" rules
-            if text.endswith('.') or text.endswith('…'):
-                # Check if there's more text after the trailing dots/ellipsis
-                rest = text.rstrip('.…').strip()
-                if not rest:  # If empty, this was truly trailing
-                    text = rest
-                    changed = True
-                # If what's left ends in an allowed char or doesn't end in period/ellipsis, we're done
-                elif not (rest.endswith('.') or rest.endswith('…')):
-                    text = rest
-                    changed = True
-                # Otherwise keep going (more trailing periods/ellipsis to remove)
-                else:
-                    text = rest
-                    changed = True
+        # Trailing whitespace alone is left as is
+        if text[-1:] not in self._TRAILING_TO_REMOVE:
+            return text
 
-            # Then check for any other special characters that aren't allowed at the end
-            for orig, repl in self.CHAR_REPLACEMENTS.items():
-                if text.endswith(repl) and repl not in self.ALLOWED_TRAILING_CHARS:
-                    text = text[:-len(repl)].rstrip()
-                    changed = True
-                    break
+        # Remove the whole trailing run of periods, ellipses, disallowed chars and whitespace at once
+        cleaned = self._TRAILING_RUN_RE.sub('', text)
 
-            if not changed:
-                break  # No more trailing characters to remove
+        # Removing trailing periods/ellipsis also strips leading whitespace
+        removed = text[len(cleaned):]
+        if '.' in removed or '…' in removed:
+            cleaned = cleaned.lstrip()
 
-        return text
+        return cleaned
 
     def _clean_filename(self, filename: str) -> str:
         """Clean filename to be NTFS-compatible."""
+        # Pick up a replaced CHAR_REPLACEMENTS or ABBREVIATIONS (two identity checks when neither was)
+        self._refresh_tables()
 
-        try:
-            filename.encode('utf-16')
-        except UnicodeEncodeError as e:
-            raise ValueError(f"Input filename contains invalid characters: {e}")
+        # ASCII names (a flag CPython already stores on the string) can't hold lone surrogates
+        # and are always NFC, so they skip both Unicode checks
+        is_ascii = filename.isascii()
+        if not is_ascii:
+            try:
+                filename.encode('utf-16')
+            except UnicodeEncodeError as e:
+                raise ValueError(f"Input filename contains invalid characters: {e}")
 
         self.debug_print(f"\nProcessing: {filename!r}", level='normal')
 
+        # Compose decomposed (NFD) names, e.g. from macOS, so 'e' + U+0301 matches like 'é'
+        # is_normalized is a quick check, so already-composed names skip the normalize call
+        if not is_ascii and not unicodedata.is_normalized('NFC', filename):
+            filename = unicodedata.normalize('NFC', filename)
+            self.debug_print(f"Normalized to NFC: {filename!r}", level='normal')
+
         # Initialize titled_parts at the beginning to ensure it's always defined
         titled_parts = [filename]
 
         # Normalize whitespace in the original filename
         original_filename = filename
-        filename = re.sub(r'[\n\r\t\f\v]+', ' ', filename)  # Convert newlines and other whitespace to spaces
-        filename = re.sub(r' {2,}', ' ', filename)  # Collapse multiple spaces
+        filename = self._WHITESPACE_RUN_RE.sub(' ', filename)  # Convert newlines, tabs and multiple spaces to one space
         if filename != original_filename:
             self.debug_print(f"Normalized whitespace: {filename!r}", level='normal')
 
@@ -1647,13 +1902,11 @@ class FileRenamer:
         else:
             # Find last period that could be a valid extension separator
             # (not part of trailing periods and not followed by space)
-            last_period = -1
-            for i in range(len(filename)-1, -1, -1):
-                if filename[i] == '.' and (i == len(filename)-1 or filename[i+1] != '.'):
-                    potential_ext = filename[i+1:]
-                    if ' ' not in potential_ext:  # Extension cannot contain spaces
-                        last_period = i
-                        break
+            # The last period is never followed by another period, and any earlier
+            # candidate's extension would contain this one, so only it needs checking
+            last_period = filename.rfind('.')
+            if last_period != -1 and ' ' in filename[last_period+1:]:  # Extension cannot contain spaces
+                last_period = -1
 
             if last_period != -1:
                 name = filename[:last_period]
@@ -1666,16 +1919,13 @@ class FileRenamer:
         # - Keep the original filename case (don't title case it)
         # - Always use lowercase for the extension
 
-        # Get reference to replacements dict for cleaner code
-        R = FileRenamer.CHAR_REPLACEMENTS
-
         # First normalize all whitespace to single spaces
         # Debug processing steps
         self.debug_print(f"Splitting name: {name!r} (extension: {extension!r})", level='detail')
 
         # Whitespace already normalized at the beginning
         # Just collapse any multiple spaces that might have been introduced during processing
-        name = re.sub(r' {2,}', ' ', name)  # Collapse multiple spaces
+        name = self._MULTIPLE_SPACES_RE.sub(' ', name)  # Collapse multiple spaces
 
         try:
             # First replace special characters
@@ -1696,14 +1946,9 @@ class FileRenamer:
             raise
 
         # Show replaced characters in color in the final output
-        colored_parts = []
-        for c in name:
-            if any(c == repl for repl in R.values()):
-                colored_parts.append(FileRenamer.colorize(c))
-            else:
-                colored_parts.append(c)
-        colored_name = ''.join(colored_parts)
+        # Only build the colored name together with its debug output, which is currently disabled
         # Don't use !r here as it escapes the color codes
+        # colored_name = ''.join(FileRenamer.colorize(c) if c in self._REPLACEMENT_VALUES else c for c in name)
         # self.debug_print(f"After replacements: '{colored_name}'", level='normal')
 
         # Clean up whitespace
@@ -1720,9 +1965,7 @@ class FileRenamer:
             # Get the potential extension and clean it of special characters
             potential_ext = name.split('.')[-1]
             # Remove any special replacement characters that aren't valid in extensions
-            for orig, repl in self.CHAR_REPLACEMENTS.items():
-                potential_ext = potential_ext.replace(repl, '')
-            potential_ext = potential_ext.lower()
+            potential_ext = potential_ext.translate(self._DELETE_REPLACEMENTS_TABLE).lower()
             self.debug_print(f"Potential extension found (after cleanup): {potential_ext!r}")
             if potential_ext in self.KNOWN_EXTENSIONS:
                 name = name[:-(len(potential_ext) + 1)]  # remove .ext
@@ -1749,30 +1992,24 @@ class FileRenamer:
             # Pre-processing: Add spaces between adjacent preserved term markers
             # This ensures they'll be properly split into separate parts
             adjacent_markers_found = False
-            while re.search(r'(__PRESERVED_TERM_\d+__)(__PRESERVED_TERM_\d+__)', name):
+            while self._ADJACENT_MARKERS_RE.search(name):
                 if not adjacent_markers_found:
                     adjacent_markers_found = True
-                name = re.sub(r'(__PRESERVED_TERM_\d+__)(__PRESERVED_TERM_\d+__)', r'\1 \2', name)
+                name = self._ADJACENT_MARKERS_RE.sub(r'\1 \2', name)
 
             if adjacent_markers_found:
                 self.debug_print(f"[SPLIT] After adding spaces between adjacent markers: {name}", level='normal')
 
-            # Build pattern that matches our word boundaries
-            word_boundary_pattern = '([' + ''.join(re.escape(c) for c in self.WORD_BOUNDARY_CHARS) + '])'
-
-            # Use the word boundary pattern for splitting
-            split_pattern = word_boundary_pattern
-            # self.debug_print(f"Split pattern: {split_pattern}")
-
             # First do a quick validation of how many parts we might get
-            test_parts = re.split(split_pattern, name)
+            # Split on our word boundaries, keeping them as parts
+            test_parts = self._WORD_BOUNDARY_SPLIT_RE.split(name)
             self.debug_print(f"[SPLIT] Initial parts after splitting: {test_parts[:10]}... (total: {len(test_parts)})", level='normal')
             if len(test_parts) > 200:  # Very generous limit, normal files have 30-90 parts
                 self.debug_print(f"Filename too complex: {len(test_parts)} parts exceeds limit of 200")
                 return name  # Return original name if too complex
 
             # Filter out empty parts
-            parts = [p for p in test_parts if p != '']
+            parts = list(filter(None, test_parts))
 
             titled_parts = []
             prev_part = ''
@@ -1783,32 +2020,51 @@ class FileRenamer:
             # Initialize processed_parts to track which parts have been processed
             processed_parts = [None] * len(parts)
 
-            last_real_word = None
-            for part in parts:
-                if part and len(part) > 1 and not any(c in self.WORD_BOUNDARY_CHARS for c in part):
-                    last_real_word = part.lower()
+            # Last word of 2+ chars with no boundary chars; scan from the end and stop at the first one
+            last_real_word = next(
+                (part.lower() for part in reversed(parts)
+                 if len(part) > 1 and self.WORD_BOUNDARY_CHARS.isdisjoint(part)),
+                None)
 
             # Now process each part with error trapping
+            # Evaluated once so the per-part trace below costs nothing when debugging is off
+            debug = logger.isEnabledFor(logging.DEBUG)
             try:
                 for i, part in enumerate(parts):
-                    self.debug_print(f"\nProcessing part {i}: {part!r} (len={len(part)}, has_boundary={[c for c in part if c in self.WORD_BOUNDARY_CHARS]})")
+                    if debug:
+                        self.debug_print(f"\nProcessing part {i}: {part!r} (len={len(part)}, has_boundary={[c for c in part if c in self.WORD_BOUNDARY_CHARS]})")
+
+                    # Handle word boundary characters with one lookup. No marker, built-in preserved
+                    # term or contraction is a single boundary char, so only preserved terms added by
+                    # user settings and a period after an abbreviation or date (handled below) need to go further
+                    resets_abbrev = self._BOUNDARY_RESETS_ABBREV.get(part)
+                    if (resets_abbrev is not None and part not in self._preserved_terms_set and
+                            not (part == '.' and (prior_abbreviation or prior_date_part))):
+                        # self.debug_print(f"Keeping separator: {part!r}")
+                        titled_parts.append(part)
+                        prev_part = part
+                        # Only reset prev_was_abbrev for spaces and periods
+                        if resets_abbrev:
+                            prev_was_abbrev = False
+                        continue
 
                     # Check if this part contains a preserved term marker
-                    if any(marker_prefix in part.upper() for marker_prefix in ["__PRESERVED_TERM_"]):
-                        # Find which original term this marker corresponds to
-                        original_term = "unknown"
-                        for marker, term in self._preserved_term_originals.items():
-                            if marker.strip() in part:
-                                original_term = term
-                                break
-
+                    # Upper-casing never introduces '_', so skip the copy for parts without one
+                    if '_' in part and "__PRESERVED_TERM_" in part.upper():
                         titled_parts.append(part)
-                        self.debug_print(f"  Preserving marker as-is (original: {original_term!r})")
+                        if debug:
+                            # Find which original term this marker corresponds to
+                            original_term = "unknown"
+                            for marker, term in self._preserved_term_originals.items():
+                                if marker.strip() in part:
+                                    original_term = term
+                                    break
+                            self.debug_print(f"  Preserving marker as-is (original: {original_term!r})")
                         prev_part = part
                         continue
 
                     # Check if this part is in the PRESERVED_TERMS list - if so, add it as-is and skip processing
-                    if part in self.PRESERVED_TERMS:
+                    if part in self._preserved_terms_set:
                         titled_parts.append(part)
                         self.debug_print(f"  Preserving term as-is: {part!r}")
                         prev_part = part
@@ -1825,7 +2081,8 @@ class FileRenamer:
                     # 3. Unit check (e.g. 5kb, 10s)
                     # important since abbreviations and units can be contractions/possessives ("I'd" vs "M. D." vs "5 d" or "John's" vs "10 s"). Contractions/possessives must be immediately preceded by an apostrophe-like character.
 
-                    self.debug_print(f"⮑ Word: {word!r} (prev_part={prev_part!r}, Found Abbrev: {titled_parts[-1] if titled_parts and titled_parts[-1] in self.ABBREVIATIONS else None}, PriorDatePart: {prior_date_part})")
+                    if debug:
+                        self.debug_print(f"⮑ Word: {word!r} (prev_part={prev_part!r}, Found Abbrev: {titled_parts[-1] if titled_parts and titled_parts[-1] in self.ABBREVIATIONS else None}, PriorDatePart: {prior_date_part})")
                     # Check for contractions/possessives first (before unit check)
                     if word in self.CONTRACTIONS and len(titled_parts) >= 2:
                         # Get the full contraction (e.g., 'Didn't' from ['Didn', "'", 't'])
@@ -1866,23 +2123,13 @@ class FileRenamer:
                         prev_part = part
                         continue
 
-                    # Handle other word boundary characters
-                    if len(part) == 1 and part in self.WORD_BOUNDARY_CHARS:
-                        # self.debug_print(f"Keeping separator: {part!r}")
-                        titled_parts.append(part)
-                        prev_part = part
-                        # Only reset prev_was_abbrev for spaces and periods
-                        if part in {' ', '.'}:
-                            prev_was_abbrev = False
-                        continue
-
                     # First check if this part could be part of an abbreviation
                     # This must come before unit/contraction checks to properly handle cases like:
                     # - "m.d" -> "MD" (abbreviation)
                     # - "10d" -> "10d" (unit)
                     # - "I'd" -> "I'd" (contraction)
                     # Only debug abbreviation check if this might be an abbreviation
-                    if part.isalpha() or (len(part) > 1 and any(c.isalpha() for c in part)):
+                    if debug and (part.isalpha() or (len(part) > 1 and any(c.isalpha() for c in part))):
                         self.debug_print(f"  Checking abbreviation: part={part!r} isalpha={part.isalpha()!r}")
                         try:
                             self.debug_print(f"    titled_parts[-2]={titled_parts[-2]!r}   titled_parts[-1]={titled_parts[-1]!r}")
@@ -1909,36 +2156,35 @@ class FileRenamer:
 
                                 # Check if first part is an abbreviation
                                 first_abbrev_upper = first_abbrev.upper()
-                                is_first_part_abbrev = any(a.upper() == first_abbrev_upper for a in self.ABBREVIATIONS)
+                                is_first_part_abbrev = first_abbrev_upper in self._ABBREVIATIONS_BY_UPPER
                                 if is_first_part_abbrev:
                                     self.debug_print(f"    First part {first_abbrev!r} is an abbreviation")
 
                                 if is_first_part_abbrev:
                                     # Only check second part if first part is an abbreviation
-                                    for abbr in self.ABBREVIATIONS:
-                                        if part.upper() == abbr.upper():
-                                            # Found abbreviation-period-abbreviation pattern
-                                            second_abbrev = abbr  # Use case from ABBREVIATIONS
-
-                                            # Combine abbreviations
-                                            try:
-                                                titled_parts[-2] = first_abbrev + second_abbrev
-                                                self.debug_print(f"  ✓ Combined: {first_abbrev!r}.{second_abbrev!r} → {titled_parts[-2]!r}")
-                                                # Remove the period
-                                                titled_parts.pop(-1)
-                                            except Exception as e:
-                                                self.debug_print(f"    ERROR in combine: {e}")
-
-                                            # Update tracking variables
-                                            if titled_parts:
-                                                prev_part = titled_parts[-1]  # Now points to the combined abbreviation after period removal
-                                                prev_was_abbrev = True
-                                                prior_abbreviation = titled_parts[-1]  # Track compound as prior_abbreviation
-                                            else:
-                                                self.debug_print(f"    WARNING: titled_parts is empty after combine operation")
-                                            break
-
-                                if not is_first_part_abbrev and part.upper() in [a.upper() for a in self.ABBREVIATIONS]:
+                                    abbr = self._ABBREVIATIONS_BY_UPPER.get(part.upper())
+                                    if abbr is not None:
+                                        # Found abbreviation-period-abbreviation pattern
+                                        second_abbrev = abbr  # Use case from ABBREVIATIONS
+
+                                        # Combine abbreviations
+                                        try:
+                                            titled_parts[-2] = first_abbrev + second_abbrev
+                                            self.debug_print(f"  ✓ Combined: {first_abbrev!r}.{second_abbrev!r} → {titled_parts[-2]!r}")
+                                            # Remove the period
+                                            titled_parts.pop(-1)
+                                        except Exception as e:
+                                            self.debug_print(f"    ERROR in combine: {e}")
+
+                                        # Update tracking variables
+                                        if titled_parts:
+                                            prev_part = titled_parts[-1]  # Now points to the combined abbreviation after period removal
+                                            prev_was_abbrev = True
+                                            prior_abbreviation = titled_parts[-1]  # Track compound as prior_abbreviation
+                                        else:
+                                            self.debug_print(f"    WARNING: titled_parts is empty after combine operation")
+
+                                if not is_first_part_abbrev and part.upper() in self._ABBREVIATIONS_BY_UPPER:
                                     self.debug_print(f"    Not combined: {first_abbrev!r} is not an abbreviation, but {part!r} is")
                                 self.debug_print(f"    Result: {''.join(titled_parts)!r}")
 
@@ -1961,9 +2207,9 @@ class FileRenamer:
                                 continue
 
                     # Special case: AM/PM after numbers (including when joined like "9am")
-                    if re.match(r'\d+[ap]m\b', word, re.IGNORECASE):
+                    if self._TIME_RE.match(word):
                         self.debug_print(f"Found time with AM/PM: {word!r}")
-                        num = re.search(r'\d+', word, re.IGNORECASE).group()
+                        num = self._DIGITS_RE.search(word).group()
                         ampm = word[len(num):].upper()
                         titled_parts.append(f"{num}{ampm}")
                         prev_part = part
@@ -1979,19 +2225,19 @@ class FileRenamer:
 
                     # Handle common unit patterns (GB, MHz, etc.)
                     found_unit = False
-                    word_lower = word.lower()
 
                     # Try unit patterns for:
                     # 1. Standard units (GB, MHz, Ω, etc.)
                     # 2. Dates with month abbreviations (2025jan12, jan2025)
                     # 3. Units after a slash (30km/hr)
                     # This must come before abbreviation check to handle concatenated formats
-                    if (re.match(r'^\d+[kmgtw]?[wvajnlhzbfω][h]?', word_lower) or  # Standard units (including compound like wh)
-                        re.match(r'^\d+[a-z]|^[a-z]+\d', word_lower) or      # Date formats
+                    if (self._NUMBER_UNIT_START_RE.match(word_lower) or  # Standard units (including compound like wh)
+                        self._NUMBER_LETTER_START_RE.match(word_lower) or   # Date formats
                         word_lower in self.STANDALONE_UNITS or                # Standalone units
                         word_lower.isdigit()):                               # Standalone digits for space-separated units
-                        self.debug_print(f"⮑ Unit check for: {part!r} (lower={word_lower!r})")
-                        self.debug_print(f"  Context: parts[{i}] in {parts[max(0,i-1):min(len(parts),i+3)]!r}")
+                        if debug:
+                            self.debug_print(f"⮑ Unit check for: {part!r} (lower={word_lower!r})")
+                            self.debug_print(f"  Context: parts[{i}] in {parts[max(0,i-1):min(len(parts),i+3)]!r}")
 
                         # Initialize unit tracking
                         unit_end_index = i  # Index of the last part of this unit (initially just the current part)
@@ -2004,7 +2250,7 @@ class FileRenamer:
                             self.debug_print(f"  Checking for space-separated unit at index {i}: {parts[i:i+3]!r}")
                             # Check if the part after the space is a valid unit
                             next_part = parts[i+2].strip().lower()
-                            if re.match(r'^[kmgtw]?[wvajnlhzbfg]', next_part) or next_part in self.STANDALONE_UNITS:
+                            if self._UNIT_START_RE.match(next_part) or next_part in self.STANDALONE_UNITS:
                                 # Include space and unit part
                                 unit_parts.extend([parts[i+1], parts[i+2]])
                                 original_parts.extend([parts[i+1], parts[i+2]])
@@ -2012,90 +2258,92 @@ class FileRenamer:
                                 unit_end_index = i + 2  # Update to include the space and unit part
                                 self.debug_print(f"  Found space-separated unit: {unit_parts!r}")
 
-                        self.debug_print(f"  Testing unit pattern: {test_word!r}  Original parts: {original_parts!r}")
-
-                        # Try to match unit patterns
-                        for pattern, formatter in sorted(self.UNIT_PATTERNS.items(), key=lambda x: len(x[0]), reverse=True):
-                            match = re.match(f'^{pattern}$', test_word, re.IGNORECASE)
-                            if match:  # Case-insensitive exact match
-                                # For bits/bytes and bps units, enforce prefix case but preserve b/B
-                                if re.search(r'\d+[kmgt]?b(?:ps)?\b', test_word, re.IGNORECASE):
-                                    # Find the unit part (kb, MB, bps, Bps etc)
-                                    unit_match = re.search(r'[kmgt]?b(?:ps)?\b', test_word, re.IGNORECASE)
-                                    if unit_match:
-                                        # Get original case for just the b/B part
-                                        orig_b_case = None
-                                        for p in original_parts:
-                                            if unit_match.group().lower() in p.lower():
-                                                # Match the b/B and optional ps
-                                                b_pattern = r'[bB](?:[pP][sS])?\b'
-                                                b_search = re.search(b_pattern, p)
-                                                if b_search:
-                                                    orig_b_case = b_search.group()
-                                                    break
-
-                                        if orig_b_case:
-                                            # Extract the prefix and number
-                                            prefix_match = re.match(r'(\d+)([kmgt])?', test_word, re.IGNORECASE)
-                                            if prefix_match:
-                                                number = prefix_match.group(1)
-                                                prefix = prefix_match.group(2)
-
-                                                # Apply prefix case rules
-                                                if prefix:
-                                                    if prefix.lower() == 'k':
-                                                        prefix = 'k'  # Always lowercase
-                                                    else:
-                                                        prefix = prefix.upper()  # M, G, T always uppercase
-
-                                                # Combine with preserved b/B case
-                                                formatted = f"{number}{prefix or ''}{orig_b_case}"
-                                                self.debug_print(f"    Applied case rules: {test_word!r} -> {formatted!r}")
-                                        else:
-                                            formatted = formatter(test_word)
-                                else:
-                                    # Apply normal unit formatting
-                                    formatted = formatter(test_word)
+                        if debug:
+                            self.debug_print(f"  Testing unit pattern: {test_word!r}  Original parts: {original_parts!r}")
+
+                        # Try to match unit patterns (all patterns in one regex, tried in order)
+                        unit_pattern_match = self._UNIT_PATTERNS_RE.fullmatch(test_word)
+                        if unit_pattern_match:  # Case-insensitive exact match of the first matching pattern
+                            pattern, formatter = self._UNIT_FORMATTERS[unit_pattern_match.lastindex]
+                            # For bits/bytes and bps units, enforce prefix case but preserve b/B
+                            if self._NUMBER_BYTES_RE.search(test_word):
+                                # Find the unit part (kb, MB, bps, Bps etc)
+                                unit_match = self._BYTES_UNIT_RE.search(test_word)
+                                if unit_match:
+                                    # Get original case for just the b/B part
+                                    orig_b_case = None
+                                    for p in original_parts:
+                                        if unit_match.group().lower() in p.lower():
+                                            # Match the b/B and optional ps
+                                            b_search = self._B_CASE_RE.search(p)
+                                            if b_search:
+                                                orig_b_case = b_search.group()
+                                                break
+
+                                    if orig_b_case:
+                                        # Extract the prefix and number
+                                        prefix_match = self._NUMBER_PREFIX_RE.match(test_word)
+                                        if prefix_match:
+                                            number = prefix_match.group(1)
+                                            prefix = prefix_match.group(2)
+
+                                            # Apply prefix case rules
+                                            if prefix:
+                                                if prefix.lower() == 'k':
+                                                    prefix = 'k'  # Always lowercase
+                                                else:
+                                                    prefix = prefix.upper()  # M, G, T always uppercase
+
+                                            # Combine with preserved b/B case
+                                            formatted = f"{number}{prefix or ''}{orig_b_case}"
+                                            self.debug_print(f"    Applied case rules: {test_word!r} -> {formatted!r}")
+                                    else:
+                                        formatted = formatter(test_word) if formatter else test_word
+                            else:
+                                # Apply normal unit formatting
+                                formatted = formatter(test_word) if formatter else test_word
 
-                                unit_debug = f"✓ Unit: {formatted!r} (from={original_parts!r}, pattern={pattern!r})"
+                            unit_debug = f"✓ Unit: {formatted!r} (from={original_parts!r}, pattern={pattern!r})"
+                            if debug:
                                 self.debug_print(f"    Applied formatter: {test_word!r} -> {formatted!r}")
 
-                                # Mark all parts that make up this unit as processed
-                                unit_start_index = i  # Start index of the unit (current part)
+                            # Mark all parts that make up this unit as processed
+                            unit_start_index = i  # Start index of the unit (current part)
+                            if debug:
                                 self.debug_print(f"  Marking parts from unit_start_index={unit_start_index} to unit_end_index={unit_end_index} as processed")
-                                for idx in range(unit_start_index, unit_end_index+1):
-                                    processed_parts[idx] = f"part of {unit_debug}"
-
-                                # Add the formatted unit preserving any spaces
-                                # Replace the matched content with formatted version
-                                parts_with_spaces = []
-                                for p in original_parts:
-                                    if p.strip().lower() == test_word.lower():
-                                        parts_with_spaces.append(formatted)
-                                    else:
-                                        parts_with_spaces.append(p)
+                            for idx in range(unit_start_index, unit_end_index+1):
+                                processed_parts[idx] = f"part of {unit_debug}"
+
+                            # Add the formatted unit preserving any spaces
+                            # Replace the matched content with formatted version
+                            parts_with_spaces = []
+                            test_word_lower = test_word.lower()
+                            for p in original_parts:
+                                if p.strip().lower() == test_word_lower:
+                                    parts_with_spaces.append(formatted)
+                                else:
+                                    parts_with_spaces.append(p)
 
-                                formatted_with_spaces = ''.join(parts_with_spaces)
-                                titled_parts.append(formatted_with_spaces)
-                                prev_part = formatted  # Store just the unit as prev_part
+                            formatted_with_spaces = ''.join(parts_with_spaces)
+                            titled_parts.append(formatted_with_spaces)
+                            prev_part = formatted  # Store just the unit as prev_part
 
+                            if debug:
                                 self.debug_print(f"  {unit_debug}")
-                                found_unit = True
-                                # Don't modify loop counter directly, we'll use processed_parts to skip
-                                # already processed parts in the next iterations
+                            found_unit = True
+                            # Don't modify loop counter directly, we'll use processed_parts to skip
+                            # already processed parts in the next iterations
+                            if debug:
                                 self.debug_print(f"  Found unit at index {i}, marked parts {i} to {unit_end_index} as processed")
                                 self.debug_print(f"  Next parts to process: {parts[unit_end_index+1:]!r}" if unit_end_index+1 < len(parts) else "  No more parts to process")
                                 self.debug_print(f"  titled_parts after unit found: {titled_parts!r}")
-                                # Important: Continue with the main loop after processing this unit
-                                # This only breaks out of the inner loop that was checking for unit patterns
-                                break
 
                         if not found_unit:
                             # Only try number-word if no unit pattern matched
-                            if re.match(r'^\d+[a-z]+$', word_lower):
+                            if self._NUMBER_WORD_RE.match(word_lower):
                                 self.debug_print(f"  Found number-word: {word!r}")
                                 # Find where the numbers end and letters begin
-                                match = re.match(r'^(\d+)([a-z]+)$', word_lower)
+                                match = self._NUMBER_WORD_RE.match(word_lower)
                                 if match:
                                     numbers, letters = match.groups()
                                     word = numbers + letters[0].upper() + letters[1:]
@@ -2109,7 +2357,8 @@ class FileRenamer:
                     # This replaces the previous 'if found_unit: continue' approach
                     # try:
                     if processed_parts[i] and processed_parts[i].startswith('part of'):
-                        self.debug_print(f"  Skipping already processed part: {parts[i]!r} at index {i}")
+                        if debug:
+                            self.debug_print(f"  Skipping already processed part: {parts[i]!r} at index {i}")
                         continue
                     # except Exception as e:
                         # self.debug_print(f"  ERROR checking processed_parts[{i}]: {e}")
@@ -2119,7 +2368,8 @@ class FileRenamer:
                             self.debug_print(f"  After unit processing: titled_parts={titled_parts!r}")
                             self.debug_print(f"  Remaining parts to process: {parts[i+1:]!r}")
                         else:
-                            self.debug_print(f"  No unit found, for {word!r}")
+                            if debug:
+                                self.debug_print(f"  No unit found, for {word!r}")
                     except Exception as e:
                         self.debug_print(f"  ERROR in found_unit check: {e}")
 
@@ -2139,27 +2389,26 @@ class FileRenamer:
                     found_abbrev = None
                     abbrev_debug = ""
 
-                    self.debug_print(f"  Abbrev check: {test_word!r} (end={j >= len(parts) - 1})")
+                    if debug:
+                        self.debug_print(f"  Abbrev check: {test_word!r} (end={j >= len(parts) - 1})")
 
                     # Try exact match first (case-insensitive)
-                    for abbr in self.ABBREVIATIONS:
-                        if test_word.upper() == abbr.upper():
-                            found_abbrev = abbr  # Use case from ABBREVIATIONS
-                            abbrev_debug = f"✓ {found_abbrev!r} (exact)"
-                            break
+                    abbr = self._ABBREVIATIONS_BY_UPPER.get(test_word)
+                    if abbr is not None:
+                        found_abbrev = abbr  # Use case from ABBREVIATIONS
+                        abbrev_debug = f"✓ {found_abbrev!r} (exact)"
                     else:
                         # Try without periods
-                        clean_word = self._clean_abbreviation(test_word)
-                        for abbr in self.ABBREVIATIONS:
-                            if clean_word.upper() == abbr.upper():
-                                found_abbrev = abbr
-                                abbrev_debug = f"✓ {found_abbrev!r} (no periods)"
-                                break
+                        clean_word = self._clean_abbreviation(test_word)  # Still uppercase
+                        abbr = self._ABBREVIATIONS_BY_UPPER.get(clean_word)
+                        if abbr is not None:
+                            found_abbrev = abbr
+                            abbrev_debug = f"✓ {found_abbrev!r} (no periods)"
 
                     # Check if it's in our special dictionary of words that should only be kept capitalized if all caps
                     # Only run this if we haven't already found an abbreviation through other methods
                     if not found_abbrev:
-                        abbrev_upper = word.upper()
+                        abbrev_upper = test_word
                         if abbrev_upper in self.KEEP_CAPITALIZED_IF_ALLCAPS:
                             # For special abbreviations, keep capitalized only if original was all caps
                             if part.isupper():
@@ -2187,7 +2436,7 @@ class FileRenamer:
 
                         if '.' in found_abbrev:
                             # Split into parts to preserve periods
-                            parts_to_add = re.split(r'([.])', found_abbrev)
+                            parts_to_add = self._PERIOD_SPLIT_RE.split(found_abbrev)
                             titled_parts.extend(parts_to_add)
                             prev_part = found_abbrev  # Keep the full abbreviation as previous part
                             prev_was_abbrev = True  # Mark that we found a valid abbreviation
@@ -2220,46 +2469,53 @@ class FileRenamer:
 
                     is_between_spaces = prev_part == ' '
 
-                    # Find the last non-space part for checking capitalization triggers
-                    last_non_space = next((p for p in reversed(titled_parts) if p.strip()), '') if titled_parts else ''
+                    # Only a LOWERCASE_WORDS word between spaces that is neither the first nor the
+                    # last word can stay lowercase; every other word is capitalized
+                    lowercase_candidate = (word in self.LOWERCASE_WORDS and
+                                           titled_parts and  # Not first word
+                                           word != last_real_word and  # Not the last word
+                                           is_between_spaces)  # Between spaces, not after special char
+
+                    # Find the last non-space part for checking capitalization triggers;
+                    # only a lowercase candidate (or the debug trace) needs it
+                    after_trigger = False
+                    if (lowercase_candidate or debug) and titled_parts and word != last_real_word:
+                        # Usually the last part itself; only walk back past a trailing space
+                        last_non_space = titled_parts[-1]
+                        if not last_non_space.strip():
+                            last_non_space = next((p for p in reversed(titled_parts) if p.strip()), '')
+                        after_trigger = last_non_space in self.CAPITALIZATION_TRIGGERS
 
                     # Always capitalize after certain punctuation or if it's the first/last word
-                    # self.debug_print(f"  Title case check: first={not titled_parts}, last={word == last_real_word}, after_trigger={last_non_space in self.CAPITALIZATION_TRIGGERS}")
+                    # self.debug_print(f"  Title case check: first={not titled_parts}, last={word == last_real_word}, after_trigger={after_trigger}")
                     should_capitalize = (
                         not titled_parts or  # First word
-                        last_non_space in self.CAPITALIZATION_TRIGGERS or  # After trigger characters
+                        after_trigger or  # After trigger characters
                         word == last_real_word  # Last word
                     )
-                    # First check if we should force capitalize
-                    reason = ('First word' if not titled_parts else
-                             'Last word' if word == last_real_word else
-                             'After punctuation' if last_non_space in self.CAPITALIZATION_TRIGGERS else
-                             'Between special chars' if not is_between_spaces else
-                             'Unknown')
-
                     # Then check if we should force lowercase
-                    should_lowercase = (word in self.LOWERCASE_WORDS and
-                                      titled_parts and  # Not first word
-                                      not should_capitalize and  # Not after period/ellipsis
-                                      word != last_real_word and  # Not the last word
-                                      is_between_spaces)  # Between spaces, not after special char
-
-                    case_reason = f"capitalize ({reason})" if should_capitalize else \
-                                 f"lowercase (in list)" if should_lowercase else \
-                                 f"capitalize (not in lowercase list)"
-                    self.debug_print(f"  Case: {case_reason}")
-                    if (word in self.LOWERCASE_WORDS and
-                        titled_parts and      # Not first word
-                        not should_capitalize and  # Not after period/ellipsis
-                        word != last_real_word and  # Not the last word
-                        is_between_spaces):   # Between spaces, not after special char
-
+                    should_lowercase = lowercase_candidate and not should_capitalize  # Not after period/ellipsis
+
+                    if debug:
+                        reason = ('First word' if not titled_parts else
+                                 'Last word' if word == last_real_word else
+                                 'After punctuation' if after_trigger else
+                                 'Between special chars' if not is_between_spaces else
+                                 'Unknown')
+                        case_reason = f"capitalize ({reason})" if should_capitalize else \
+                                     f"lowercase (in list)" if should_lowercase else \
+                                     f"capitalize (not in lowercase list)"
+                        self.debug_print(f"  Case: {case_reason}")
+                    if should_lowercase:
                         self.debug_print(f"  Adding to titled_parts: {word!r} (lowercase)")
                         processed_word = word
                         titled_parts.append(processed_word)
                     else:
+                        # word is already lowercase, so capitalize() only changes the first char, in one
+                        # C call; it uses title case for it (ǆ -> ǅ, ß -> Ss), unlike word[:1].upper()
                         processed_word = word.capitalize()
-                        self.debug_print(f"  Adding to titled_parts: {processed_word!r} (capitalized)")
+                        if debug:
+                            self.debug_print(f"  Adding to titled_parts: {processed_word!r} (capitalized)")
                         titled_parts.append(processed_word)
                     prev_part = processed_word  # Store the processed version, not the original
                     prior_abbreviation = None  # Reset for non-abbreviation word
@@ -2313,57 +2569,51 @@ class FileRenamer:
             # Continue with the unmodified titled_parts as a fallback
 
         # Handle periods in preserved terms by replacing with a placeholder
-        PRESERVED_PERIOD_PLACEHOLDER = '__PRESERVED_TERM_PERIOD__'
-        preserved_terms_with_periods = [term for term in self.PRESERVED_TERMS if '.' in term]
-
-        for term in preserved_terms_with_periods:
-            # Create a version of the term with the placeholder instead of periods
-            term_with_placeholder = term.replace('.', PRESERVED_PERIOD_PLACEHOLDER)
-
-            # Replace the term in the parts list
-            for i, part in enumerate(titled_parts):
-                # self.debug_print(f"[PRESERVED_PERIODS] Checking part vs term: {part!r} == {term!r} -> {part == term}", level='normal')
-                if part == term:
-                    titled_parts[i] = term_with_placeholder
+        # (the placeholder versions are prebuilt in _build_preserved_term_tables)
+        PRESERVED_PERIOD_PLACEHOLDER = self._PRESERVED_PERIOD_PLACEHOLDER
+        if self._preserved_period_terms:
+            # self.debug_print(f"[PRESERVED_PERIODS] Checking parts: {titled_parts!r}", level='normal')
+            titled_parts = [self._preserved_period_terms.get(part, part) for part in titled_parts]
 
         # Process periods in each part individually (excluding Preserved Terms)
         processed_parts = []
+
+        # Period handling for the part being processed; defined once, it reads
+        # the loop's current part when called
+        def handle_periods(match):
+            full_str = part  # Capture the full part for context
+            pos = match.start()
+            before_char = full_str[pos-1] if pos > 0 else ''
+            after_char = match.group(1)  # The letter after the period
+
+            # Look ahead for potential abbreviation pattern (e.g., M.D): pos + 1 is the
+            # matched letter, so a period within two chars can only be at pos + 2
+            if full_str.startswith('.', pos + 2):
+                potential_abbrev = (before_char + '.' + after_char).upper()
+                if potential_abbrev in self.ABBREVIATIONS:
+                    return f'.{after_char.upper()}'
+
+            # Check other cases
+            if before_char.isdigit() or after_char.upper() in self.ABBREVIATIONS:
+                return f'.{after_char}'
+
+            # Not an abbreviation, add space
+            result = f'. {after_char}'
+            self.debug_print(f"[PERIODS] Adding space after period: '.{after_char}' -> '{result}' (before_char={before_char!r})", level='normal')
+            return result
+
         try:
             for part in titled_parts:
                 # Skip empty parts
                 if not part:
                     continue
 
-                # Define period handling function for this part
-                def handle_periods(match):
-                    full_str = part  # Capture the full part for context
-                    pos = match.start()
-                    before_char = full_str[pos-1] if pos > 0 else ''
-                    after_char = match.group(1)  # The letter after the period
-
-                    # Look ahead for potential abbreviation pattern (e.g., M.D)
-                    next_period_pos = full_str.find('.', pos + 1)
-                    if next_period_pos != -1 and next_period_pos - pos <= 2:
-                        potential_abbrev = (before_char + '.' + after_char).upper()
-                        if potential_abbrev in self.ABBREVIATIONS:
-                            return f'.{after_char.upper()}'
-
-                    # Check other cases
-                    if before_char.isdigit() or after_char.upper() in self.ABBREVIATIONS:
-                        return f'.{after_char}'
-
-                    # Not an abbreviation, add space
-                    result = f'. {after_char}'
-                    self.debug_print(f"[PERIODS] Adding space after period: '.{after_char}' -> '{result}' (before_char={before_char!r})", level='normal')
-                    return result
-
-                # Process periods in this part
-                processed_part = re.sub(r'\.([a-zA-Z])', handle_periods, part)
+                # Process periods in this part (most parts have none)
+                processed_part = self._PERIOD_LETTER_RE.sub(handle_periods, part) if '.' in part else part
 
                 # Restore periods from PRESERVED_PERIOD_PLACEHOLDER in this part
-                placeholder_count = processed_part.count(PRESERVED_PERIOD_PLACEHOLDER)
-                if placeholder_count > 0:
-                    # self.debug_print(f"[PERIODS] Found {placeholder_count} period placeholders to restore in part: {processed_part!r}", level='normal')
+                if PRESERVED_PERIOD_PLACEHOLDER in processed_part:
+                    # self.debug_print(f"[PERIODS] Found {processed_part.count(PRESERVED_PERIOD_PLACEHOLDER)} period placeholders to restore in part: {processed_part!r}", level='normal')
                     processed_part = processed_part.replace(PRESERVED_PERIOD_PLACEHOLDER, '.')
                     self.debug_print(f"[PERIODS] After restoring period placeholders in part: {processed_part!r}", level='normal')
 
@@ -2389,7 +2639,7 @@ class FileRenamer:
                 self.debug_print(f"[PERIODS] After joining processed parts: {name!r}", level='normal')
 
                 # Clean up any double spaces
-                name = re.sub(r'\s+', ' ', name)
+                name = self._ANY_WHITESPACE_RE.sub(' ', name)
 
                 # Do one final check for trailing special characters
                 name = self._clean_trailing_chars(name)
@@ -2417,6 +2667,22 @@ class FileRenamer:
 
         return result
 
+    def clean_filenames(self, filenames: List[str]) -> List[str]:
+        """
+        Clean a batch of filenames, e.g. names gathered from several directories.
+
+        Uses the same memo as process_files, so repeated names are cleaned once
+        (unless debugging, so every name gets its trace).
+
+        Args:
+            filenames: Filenames to clean
+
+        Returns:
+            List[str]: Cleaned filenames, in the same order
+        """
+        clean = self._cleaner()
+        return [clean(filename) for filename in filenames]
+
     def process_files(self, batch_size=100) -> List[Tuple[str, str]]:
         """
         Process all files in the directory.
@@ -2436,11 +2702,22 @@ class FileRenamer:
         changes = []
         processed_count = 0
 
-        for item in self.directory.iterdir():
-            if item.is_file():
-                original_name = item.name
+        clean = self._cleaner()
+
+        # One directory read serves both the file list and the target-exists checks
+        with os.scandir(self.directory) as it:
+            entries = list(it)
+        # Composed and casefolded so names that only differ in case or normalization still
+        # get the exists() check, which is what catches them on case-insensitive filesystems
+        existing_names = {unicodedata.normalize('NFC', entry.name).casefold() for entry in entries}
+        # Targets already claimed by earlier changes in this run, in the same form
+        planned_names = set()
+
+        for entry in entries:
+            if entry.is_file():
+                original_name = entry.name
                 self.debug_print(f"\n\nBefore clean_filename: {original_name!r}", level='normal')
-                new_name = self._clean_filename(original_name)
+                new_name = clean(original_name)
                 processed_count += 1
                 self.debug_print(f"After clean_filename: {original_name!r} -> {new_name!r}", level='normal')
 
@@ -2453,10 +2730,17 @@ class FileRenamer:
                     continue
 
                 # Check if target already exists
-                if (self.directory / new_name).exists():
+                target_key = unicodedata.normalize('NFC', new_name).casefold()
+                if target_key in existing_names and (self.directory / new_name).exists():
                     self.debug_print(f"Warning: Cannot rename '{original_name}' to '{new_name}' - target exists")
                     continue
 
+                # Check if another file in this run is already being renamed to the same target
+                if target_key in planned_names:
+                    self.debug_print(f"Warning: Cannot rename '{original_name}' to '{new_name}' - another file is being renamed to it")
+                    continue
+                planned_names.add(target_key)
+
                 changes.append((original_name, new_name))
 
         return changes
@@ -2515,26 +2799,29 @@ def main():
     renamer = FileRenamer(args.directory, dry_run=args.dry_run, settings_path=args.settings_path)
     changes = renamer.process_files(batch_size=args.batch_size)
 
+    # Only highlight replacements on a terminal, and honor the NO_COLOR convention
+    use_color = sys.stdout.isatty() and not os.environ.get('NO_COLOR')
+
     if args.dry_run:
         print("\nProposed changes (dry run):\n")
-    else:
+    elif use_color:
         print("\nExecuted changes: (showing special character replacements in cyan)\n")
+    else:
+        print("\nExecuted changes:\n")
 
-    # Track if any files were changed
+    # Track if any files were changed; the listing is written in one go
+    # rather than one print (and console flush) per file
     any_changes = False
+    report = []
     for old, new in changes:
         if old == new:
-            print(f"{old}\n  ->  unchanged\n")
+            report.append(f"{old}\n  ->  unchanged\n")
         else:
             any_changes = True
-            colored_parts = []
-            for c in new:
-                if any(c == repl for repl in FileRenamer.CHAR_REPLACEMENTS.values()):
-                    colored_parts.append(FileRenamer.colorize(c))
-                else:
-                    colored_parts.append(c)
-            colored_new = ''.join(colored_parts)
-            print(f"   {old}\n-> {colored_new}\n")
+            colored_new = FileRenamer.colorize_replacements(new) if use_color else new
+            report.append(f"   {old}\n-> {colored_new}\n")
+    if report:
+        print('\n'.join(report))
 
     if not any_changes:
         print("\nNo files need to be renamed.")
@@ -2549,36 +2836,33 @@ def main():
         # Display folder information before renaming
         print(f"Renaming files in folder: {args.directory}")
 
-        # Actually rename the files
+        # Actually rename the files, using full paths in the directory
+        dir_path = Path(args.directory)
         for old, new in changes:
-            if not args.dry_run:
-                try:
-                    # Use full paths by joining the directory with the filenames
-                    old_path = os.path.join(args.directory, old)
-                    new_path = os.path.join(args.directory, new)
-                    # print(f"Renaming '{old_path}' to '{new_path}'")
-                    os.rename(old_path, new_path)
-                except OSError as e:
-                    if e.errno in (errno.EINVAL, errno.EACCES):
-                        print(f"Note: Filesystem does not allow rename on filename with special characters.")
-                        print(f"  Original name: '{old}'")
-                        print(f"  Attempted new name: '{new}'")
-                        print(f"  Error: {e}")
-                        print("This is expected on some filesystems. \nAttempting making new file and copying contents")
-                        # Create a new file with the Unicode replacement directly
-                        try:
-                            # First try to create the new file
-                            Path(new).write_bytes(Path(old).read_bytes())
-                            # If successful, remove the old file
-                            os.unlink(old)
-                        except OSError as e2:
-                            print(f"Error: Could not create new file '{new}': {e2}")
-                            raise
-                    else:
+            try:
+                old_path = dir_path / old
+                new_path = dir_path / new
+                # print(f"Renaming '{old_path}' to '{new_path}'")
+                os.rename(old_path, new_path)
+            except OSError as e:
+                if e.errno in (errno.EINVAL, errno.EACCES):
+                    print(f"Note: Filesystem does not allow rename on filename with special characters.")
+                    print(f"  Original name: '{old}'")
+                    print(f"  Attempted new name: '{new}'")
+                    print(f"  Error: {e}")
+                    print("This is expected on some filesystems. \nAttempting making new file and copying contents")
+                    # Create a new file with the Unicode replacement directly
+                    try:
+                        # First try to create the new file; copyfile streams the contents
+                        # (in-kernel where available) instead of reading the whole file into memory
+                        shutil.copyfile(old_path, new_path)
+                        # If successful, remove the old file
+                        os.unlink(old_path)
+                    except OSError as e2:
+                        print(f"Error: Could not create new file '{new}': {e2}")
                         raise
-
-# Validate replacements when module is loaded
-FileRenamer.validate_replacements()
+                else:
+                    raise
 
 @classmethod
 def load_user_settings(cls, settings_path: Optional[str] = None) -> Tuple[Set[str], Set[str]]:
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Tests for the report helpers in conftest.py.
+
+Checks how data dumps are shortened in failed AssertionError reports.
+"""
+
+from types import SimpleNamespace
+
+from conftest import _MIN_STRIP_LENGTH, _strip_data_dumps, pytest_runtest_logreport
+
+
+def test_strip_nested_brackets():
+    """Nested data is collapsed as a whole"""
+    assert _strip_data_dumps("x = {'a': [1, {2: 3}]} tail") == "x = {...} tail"
+
+
+def test_strip_unbalanced_brackets():
+    """A dump without its closing bracket is left as is"""
+    assert _strip_data_dumps("x = [1, [2, 3]") == "x = [1, [2, 3]"
+
+
+def test_strip_quoted_brackets():
+    """Brackets inside single- or double-quoted strings don't close the dump"""
+    assert _strip_data_dumps("""data = ["x]", '0', '1'] end""") == "data = [...] end"
+    assert _strip_data_dumps("""data = ['x]', "0", '\\'[', '1'] end""") == "data = [...] end"
+
+
+def test_strip_test_cases_whitespace():
+    """The test_cases dump also drops the whitespace after it"""
+    assert _strip_data_dumps("test_cases = [('a', 'b')]   \n    next") == "test_cases = [...] next"
+
+
+def test_strip_without_spaces():
+    """name=[ and name =<newline>[ are shortened like the spaced form"""
+    assert _strip_data_dumps("name=[1, 2] end") == "name = [...] end"
+    assert _strip_data_dumps("name =\n{1: 2} end") == "name = {...} end"
+
+
+def test_strip_leaves_comparisons():
+    """Only assignments to a name are shortened, not comparisons"""
+    assert _strip_data_dumps("assert a == [1, 2]") == "assert a == [1, 2]"
+
+
+class _Repr:
+    """Stand-in for pytest's ExceptionChainRepr: a crash summary and one traceback entry"""
+    def __init__(self, message, lines):
+        self.reprcrash = SimpleNamespace(message=message)
+        self.reprtraceback = SimpleNamespace(reprentries=[SimpleNamespace(lines=lines)])
+        self.chain = [(self.reprtraceback, self.reprcrash, None)]
+
+    def __str__(self):
+        return "\n".join(self.reprtraceback.reprentries[0].lines)
+
+
+def _failed_report(message, lines):
+    """A failed call report whose traceback entry has the given lines"""
+    return SimpleNamespace(when='call', failed=True, longrepr=_Repr(message, lines))
+
+
+def test_logreport_strips_assertion_reports():
+    """Long AssertionError reports get their data dumps shortened, the report itself is kept"""
+    lines = ["test_cases = [", "('a', 'b'), " * _MIN_STRIP_LENGTH + "]", "E   AssertionError: failed"]
+    report = _failed_report("AssertionError: failed", lines)
+    longrepr = report.longrepr
+    pytest_runtest_logreport(report)
+    assert report.longrepr is longrepr
+    assert report.longrepr.reprcrash.message == "AssertionError: failed"
+    assert report.longrepr.reprtraceback.reprentries[0].lines == ["test_cases = [...] E   AssertionError: failed"]
+
+
+def test_logreport_strips_unspaced_dumps():
+    """Reports with only `name=[...]` dumps are stripped too"""
+    lines = ["cases=[" + "('a', 'b'), " * _MIN_STRIP_LENGTH + "]", "E   AssertionError: failed"]
+    report = _failed_report("AssertionError: failed", lines)
+    pytest_runtest_logreport(report)
+    assert report.longrepr.reprtraceback.reprentries[0].lines == ["cases = [...]", "E   AssertionError: failed"]
+
+
+def test_logreport_leaves_other_errors():
+    """Reports for other exceptions are not changed"""
+    lines = ["test_cases = [" + "('a', 'b'), " * _MIN_STRIP_LENGTH + "]", "E   KeyError: 'k'"]
+    report = _failed_report("KeyError: 'k'", lines)
+    pytest_runtest_logreport(report)
+    assert report.longrepr.reprtraceback.reprentries[0].lines == lines
+
+
+def test_logreport_leaves_reports_without_dumps():
+    """Long reports with only scalar assignments are not changed"""
+    lines = ["x = 1, " * _MIN_STRIP_LENGTH, "E   AssertionError: failed"]
+    report = _failed_report("AssertionError: failed", lines)
+    pytest_runtest_logreport(report)
+    assert report.longrepr.reprtraceback.reprentries[0].lines == lines
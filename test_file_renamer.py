@@ -179,6 +179,19 @@ class TestFileRenamer(unittest.TestCase):
 
         self._run_test_cases(test_cases)
 
+    def test_unicode_normalization(self):
+        """Test that decomposed (NFD) names are composed to NFC.
+
+        - 'e' + combining acute accent becomes 'é'
+        - Already composed names are unchanged
+        """
+        test_cases = [
+            ('cafe\u0301 menu.txt', 'Café Menu.txt'),  # NFD, as from macOS
+            ('café menu.txt', 'Café Menu.txt'),   # NFC
+        ]
+
+        self._run_test_cases(test_cases)
+
     def test_multiple_spaces_and_punctuation(self):
         """Test handling of multiple spaces and punctuation.
 
@@ -377,6 +390,12 @@ class TestFileRenamer(unittest.TestCase):
 
         self._run_test_cases(test_cases)
 
+    def test_replaced_char_replacements(self):
+        """Test that replacing CHAR_REPLACEMENTS changes how names are cleaned (tearDown restores it)"""
+        self.assertEqual(self.renamer._clean_filename('What? now.txt'), 'What⁇ Now.txt')
+        FileRenamer.CHAR_REPLACEMENTS = {**FileRenamer.CHAR_REPLACEMENTS, '?': 'Q'}
+        self.assertEqual(self.renamer._clean_filename('What? now.txt'), 'Whatq Now.txt')
+
     def test_validate_replacements_errors(self):
         """Test error handling in validate_replacements"""
         # Test invalid type
@@ -397,6 +416,31 @@ class TestFileRenamer(unittest.TestCase):
             FileRenamer.validate_replacements()
         self.assertIn("Replacement cannot be empty", str(cm.exception))
 
+    def test_clean_filenames_batch(self):
+        """Test batch cleaning matches cleaning each name on its own."""
+        names = ['hello world.txt', 'the lord of the rings.mp4', 'hello world.txt']
+        self.assertEqual(self.renamer.clean_filenames(names),
+                         [self.renamer._clean_filename(name) for name in names])
+
+    def test_replaced_abbreviations(self):
+        """Test that replacing ABBREVIATIONS takes effect, also for names already memoized"""
+        original_abbreviations = FileRenamer.ABBREVIATIONS
+        try:
+            self.assertEqual(self.renamer.clean_filenames(['who knows.txt']), ['Who Knows.txt'])
+            FileRenamer.ABBREVIATIONS = original_abbreviations | {'WHO'}
+            self.assertEqual(self.renamer.clean_filenames(['who knows.txt']), ['WHO Knows.txt'])
+        finally:
+            FileRenamer.ABBREVIATIONS = original_abbreviations
+
+    def test_extended_preserved_terms(self):
+        """Test that adding to PRESERVED_TERMS in place takes effect for names already memoized"""
+        self.assertEqual(self.renamer.clean_filenames(['my fooBar.txt']), ['My Foobar.txt'])
+        FileRenamer.PRESERVED_TERMS.append('fooBar')
+        try:
+            self.assertEqual(self.renamer.clean_filenames(['my fooBar.txt']), ['My fooBar.txt'])
+        finally:
+            FileRenamer.PRESERVED_TERMS.remove('fooBar')
+
     def test_clean_filename_errors(self):
         """Test error handling in _clean_filename"""
         renamer = FileRenamer(str(self.temp_dir))
@@ -456,6 +500,15 @@ class TestFileRenamer(unittest.TestCase):
         self.assertTrue((self.temp_dir / "Another Test?.txt").exists())  # Original file still exists
         self.assertTrue((self.temp_dir / "Another Test⁇.txt").exists())  # Target file unchanged
 
+    def test_process_files_target_collision(self):
+        """Test that two files cleaning to the same name don't both get that target"""
+        (self.temp_dir / "Another Test?.txt").write_text("test1")
+        (self.temp_dir / "another test?.txt").write_text("test2")
+
+        changes = self.renamer.process_files()
+        self.assertEqual(len(changes), 1)
+        self.assertEqual(changes[0][1], "Another Test⁇.txt")
+
     def test_command_line(self):
         """Test command line interface.
 